@@ -6,11 +6,9 @@ and sync with video timeline.
 
 from __future__ import annotations
 
-import io
 import logging
 import subprocess
 import threading
-import wave
 from pathlib import Path
 from typing import Any
 
@@ -28,17 +26,23 @@ class AudioPlayer:
     """
 
     _CHUNK_SIZE = 1024
+    _SAMPLE_RATE = 44100
+    _CHANNELS = 2
+    _EXTRACT_TIMEOUT_SEC = 60
+    # Pre-zeroed int16 tail padding for one callback buffer, shared by all streams.
+    _SILENCE = bytes(_CHUNK_SIZE * _CHANNELS * 2)
 
     def __init__(self) -> None:
         self._source_path: Path | None = None
         self._audio_data: np.ndarray | None = None
-        self._sample_rate: int = 44100
-        self._channels: int = 2
+        self._sample_rate: int = self._SAMPLE_RATE
+        self._channels: int = self._CHANNELS
         self._fps: float = 30.0
         self._stream: pyaudio.Stream | None = None
+        # (media time in seconds, stream time it reaches the DAC) of the most
+        # recent callback buffer; written by the audio thread, read by position().
+        self._clock: tuple[float, float] | None = None
         self._pa: pyaudio.PyAudio | None = None
-        self._playback_pos: list[int] = []  # mutable, shared with callback
-        self._playback_lock = threading.Lock()
 
         try:
             self._pa = pyaudio.PyAudio()
@@ -46,80 +50,120 @@ class AudioPlayer:
             logger.warning("PyAudio initialization failed: %s. Audio disabled.", e)
             self._pa = None
 
-    def set_source(self, video_path: Path, fps: float) -> None:
+    def set_source(
+        self, video_path: Path, fps: float, duration_sec: float | None = None
+    ) -> None:
         """Extract audio from video_path using ffmpeg and load into memory.
 
         Args:
             video_path: Path to the source video file.
             fps: Video frames per second for frame-to-time conversion.
+            duration_sec: Optional duration estimate used to pre-size the
+                sample buffer; it grows as needed if the estimate is short.
         """
         self.clear()
 
         if self._pa is None:
             return
 
+        audio_data = self._extract_audio(video_path, duration_sec)
+        if audio_data is None:
+            return
+
+        self._sample_rate = self._SAMPLE_RATE
+        self._channels = self._CHANNELS
+        self._audio_data = audio_data
+        self._source_path = video_path
+        self._fps = fps
+
+    def _extract_audio(
+        self, video_path: Path, duration_sec: float | None
+    ) -> np.ndarray | None:
+        """Stream headerless s16le samples from ffmpeg into a pre-sized array.
+
+        Returns the interleaved int16 samples, or None if extraction failed.
+        """
+        samples_per_sec = self._SAMPLE_RATE * self._CHANNELS
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 [
                     "ffmpeg",
+                    "-v",
+                    "error",
+                    "-nostdin",
                     "-i",
                     str(video_path),
                     "-vn",
                     "-acodec",
                     "pcm_s16le",
                     "-ar",
-                    "44100",
+                    str(self._SAMPLE_RATE),
                     "-ac",
-                    "2",
+                    str(self._CHANNELS),
                     "-f",
-                    "wav",
+                    "s16le",
                     "pipe:1",
                 ],
-                capture_output=True,
-                timeout=60,
-                check=False,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
             )
         except FileNotFoundError:
             logger.warning("ffmpeg not found. Audio extraction disabled.")
-            self._audio_data = None
-            return
-        except subprocess.TimeoutExpired:
+            return None
+
+        timed_out = threading.Event()
+
+        def on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        # One second of slack so an accurate estimate never needs to grow.
+        capacity = int((duration_sec or 0.0) * samples_per_sec) + samples_per_sec
+        data = np.empty(capacity, dtype=np.int16)
+        filled = 0  # bytes
+        killer = threading.Timer(self._EXTRACT_TIMEOUT_SEC, on_timeout)
+        killer.start()
+        try:
+            while True:
+                if filled == data.nbytes:
+                    grown = np.empty(len(data) * 2, dtype=np.int16)
+                    grown[: len(data)] = data
+                    data = grown
+                n = proc.stdout.readinto(memoryview(data).cast("B")[filled:])
+                if not n:
+                    break
+                filled += n
+            stderr = proc.stderr.read()
+            proc.wait()
+        finally:
+            killer.cancel()
+            proc.stdout.close()
+            proc.stderr.close()
+
+        if timed_out.is_set():
             logger.warning("ffmpeg audio extraction timed out for %s", video_path)
-            self._audio_data = None
-            return
+            return None
 
-        if result.returncode != 0:
-            stderr = result.stderr.decode("utf-8", errors="replace") if result.stderr else ""
+        if proc.returncode != 0:
+            stderr_text = stderr.decode("utf-8", errors="replace") if stderr else ""
             logger.warning(
                 "ffmpeg audio extraction failed for %s: %s",
                 video_path,
-                stderr[:500] if stderr else "unknown",
+                stderr_text[:500] if stderr_text else "unknown",
             )
-            self._audio_data = None
-            return
+            return None
 
-        if not result.stdout:
+        n_samples = filled // data.itemsize
+        if n_samples == 0:
             logger.warning("ffmpeg produced no audio output for %s", video_path)
-            self._audio_data = None
-            return
+            return None
 
-        try:
-            bio = io.BytesIO(result.stdout)
-            with wave.open(bio, "rb") as wf:
-                self._sample_rate = wf.getframerate()
-                self._channels = wf.getnchannels()
-                raw_frames = wf.readframes(wf.getnframes())
-                if raw_frames:
-                    self._audio_data = np.frombuffer(raw_frames, dtype=np.int16)
-                else:
-                    self._audio_data = None
-        except Exception as e:
-            logger.warning("Failed to parse audio data from %s: %s", video_path, e)
-            self._audio_data = None
-            return
-
-        self._source_path = video_path
-        self._fps = fps
+        # Trim to what ffmpeg actually produced; copy only if the estimate was
+        # far off so the slack does not stay allocated.
+        if n_samples < len(data) // 2:
+            return data[:n_samples].copy()
+        return data[:n_samples]
 
     def clear(self) -> None:
         """Stop any playing stream and release audio data."""
@@ -177,11 +221,23 @@ class AudioPlayer:
         if sample_offset >= len(self._audio_data):
             return
 
-        self._playback_pos = [sample_offset]
-        audio_data = self._audio_data
         channels = self._channels
         chunk_size = self._CHUNK_SIZE
-        playback_lock = self._playback_lock
+        # Everything the realtime callback needs is resolved here, in byte
+        # units: it only slices the raw buffer (one memcpy into the returned
+        # bytes, which PyAudio requires), advances a closure-local offset that
+        # no other thread touches and publishes the clock as one atomic tuple
+        # store, so it holds the GIL as briefly as possible and takes no lock.
+        audio_bytes = memoryview(self._audio_data).cast("B")
+        sample_bytes = self._audio_data.itemsize
+        total_bytes = len(audio_bytes)
+        bytes_per_frame = channels * sample_bytes
+        silence = self._SILENCE
+        pos = sample_offset * sample_bytes
+        pa_continue = pyaudio.paContinue
+        pa_complete = pyaudio.paComplete
+        bytes_per_sec = self._sample_rate * bytes_per_frame
+        player = self
 
         def callback(
             in_data: bytes,
@@ -189,24 +245,22 @@ class AudioPlayer:
             time_info: dict[str, Any],
             status: int,
         ) -> tuple[bytes, int]:
-            with playback_lock:
-                pos = self._playback_pos[0]
-                total = len(audio_data)
-                frames_needed = frame_count * channels
-                end_pos = min(pos + frames_needed, total)
-                if pos >= total:
-                    return (b"", pyaudio.paComplete)
-
-                chunk = audio_data[pos:end_pos]
-                self._playback_pos[0] = end_pos
-
-                if len(chunk) < frames_needed:
-                    padding = np.zeros(frames_needed - len(chunk), dtype=np.int16)
-                    chunk = np.concatenate([chunk, padding])
-
-                if end_pos >= total:
-                    return (chunk.tobytes(), pyaudio.paComplete)
-                return (chunk.tobytes(), pyaudio.paContinue)
+            nonlocal pos
+            if pos >= total_bytes:
+                return (b"", pa_complete)
+            player._clock = (pos / bytes_per_sec, time_info["output_buffer_dac_time"])
+            needed = frame_count * bytes_per_frame
+            end = pos + needed
+            if end < total_bytes:
+                chunk = bytes(audio_bytes[pos:end])
+                pos = end
+                return (chunk, pa_continue)
+
+            chunk = bytes(audio_bytes[pos:total_bytes])
+            pad = needed - len(chunk)
+            chunk += silence[:pad] if pad <= len(silence) else bytes(pad)
+            pos = total_bytes
+            return (chunk, pa_complete)
 
         try:
             self._stream = self._pa.open(
@@ -222,6 +276,27 @@ class AudioPlayer:
             logger.warning("Failed to start audio playback: %s", e)
             self._stream = None
 
+    def position(self) -> float | None:
+        """Return the media time in seconds currently being heard.
+
+        Derived from the audio device clock, so it can serve as the master
+        clock for video during playback. Returns None when no stream is
+        playing or it has not produced its first buffer yet.
+        """
+        stream = self._stream
+        clock = self._clock
+        if stream is None or clock is None:
+            return None
+        media_sec, dac_time = clock
+        try:
+            if not stream.is_active():
+                return None
+            if dac_time <= 0.0:  # host API does not report DAC times
+                return media_sec
+            return media_sec + (stream.get_time() - dac_time)
+        except Exception:
+            return None
+
     def stop(self) -> None:
         """Stop the currently playing stream if any."""
         if self._stream is not None:
@@ -231,6 +306,13 @@ class AudioPlayer:
             except Exception as e:
                 logger.debug("Error stopping audio stream: %s", e)
             self._stream = None
+        # After stop_stream(), so an in-flight callback cannot republish it.
+        self._clock = None
+
+    @property
+    def source_path(self) -> Path | None:
+        """Return the video the loaded audio was extracted from, or None."""
+        return self._source_path
 
     @property
     def is_playing(self) -> bool:
@@ -1,10 +1,13 @@
 """Exporter module for rendering composed video views to a single output file."""
 
 import math
+import os
 import subprocess
 import tempfile
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import IO
 
 import cv2
 import numpy as np
@@ -13,45 +16,118 @@ from visualization.core.video_manager import FrameCache, VideoEntry, VideoManage
 from visualization.filters.base import BaseFilter
 
 
-def resize_with_letterbox(frame: np.ndarray, target_w: int, target_h: int) -> np.ndarray:
+def resize_with_letterbox(
+    frame: np.ndarray,
+    target_w: int,
+    target_h: int,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
     """Resize frame to fit within target_w x target_h, preserving aspect ratio.
 
-    Center the resized frame on a black canvas of target_w x target_h.
+    Center the resized frame on a black canvas of target_w x target_h. If out is
+    given (a target_h x target_w x 3 uint8 buffer or view), the frame is resized
+    directly into it and only the letterbox bands are zero-filled.
     """
+    if out is None:
+        out = np.zeros((target_h, target_w, 3), dtype=np.uint8)
+
     h, w = frame.shape[:2]
     if w <= 0 or h <= 0:
-        return np.zeros((target_h, target_w, 3), dtype=np.uint8)
+        out[:] = 0
+        return out
 
     scale = min(target_w / w, target_h / h)
-    new_w = max(1, int(round(w * scale)))
-    new_h = max(1, int(round(h * scale)))
-
-    resized = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
-
-    canvas = np.zeros((target_h, target_w, 3), dtype=np.uint8)
+    new_w = max(1, min(target_w, int(round(w * scale))))
+    new_h = max(1, min(target_h, int(round(h * scale))))
     y0 = (target_h - new_h) // 2
     x0 = (target_w - new_w) // 2
-    canvas[y0 : y0 + new_h, x0 : x0 + new_w] = resized
 
-    return canvas
+    out[:y0] = 0
+    out[y0 + new_h :] = 0
+    out[y0 : y0 + new_h, :x0] = 0
+    out[y0 : y0 + new_h, x0 + new_w :] = 0
+    cv2.resize(
+        frame, (new_w, new_h),
+        dst=out[y0 : y0 + new_h, x0 : x0 + new_w],
+        interpolation=cv2.INTER_LINEAR,
+    )
+    return out
 
 
-def _crop_to_roi(
-    frame: np.ndarray,
-    roi: tuple[float, float, float, float] | None,
-) -> np.ndarray:
-    """Crop frame to normalised ROI (x1, y1, x2, y2). No-op if roi is None."""
+def _roi_slices(
+    roi: tuple[float, float, float, float] | None, w: int, h: int
+) -> tuple[slice, slice]:
+    """Return (rows, cols) slices cropping a w x h frame to normalised ROI.
+
+    Full-frame slices if roi is None or the crop would be empty.
+    """
+    full = (slice(None), slice(None))
     if roi is None:
-        return frame
-    h, w = frame.shape[:2]
+        return full
     x1, y1, x2, y2 = roi
     cx1 = max(0, int(x1 * w))
     cy1 = max(0, int(y1 * h))
     cx2 = min(w, int(x2 * w))
     cy2 = min(h, int(y2 * h))
     if cx2 <= cx1 or cy2 <= cy1:
-        return frame
-    return frame[cy1:cy2, cx1:cx2]
+        return full
+    return (slice(cy1, cy2), slice(cx1, cx2))
+
+
+def _open_encoder(
+    output_path: Path,
+    width: int,
+    height: int,
+    fps: float,
+    stderr: IO[bytes],
+    audio_source_path: Path | None = None,
+) -> subprocess.Popen:
+    """Start an ffmpeg libx264 encoder reading raw BGR frames from stdin.
+
+    If audio_source_path is given its first audio track is muxed in by the same
+    process. Odd canvas sizes are padded by one pixel, as yuv420p needs even ones.
+    ffmpeg's diagnostics go to the stderr file rather than a pipe, which nobody
+    reads while frames are written and which could otherwise fill up and stall
+    the encoder (and with it the stdin writes).
+    """
+    cmd = [
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "rawvideo",
+        "-pixel_format", "bgr24",
+        "-video_size", f"{width}x{height}",
+        "-framerate", str(fps),
+        "-i", "pipe:0",
+    ]
+    if audio_source_path is not None:
+        cmd += [
+            "-i", str(audio_source_path),
+            "-map", "0:v:0", "-map", "1:a:0?",
+            "-c:a", "aac",
+            "-shortest",
+        ]
+    cmd += [
+        "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+        "-c:v", "libx264",
+        "-preset", "ultrafast",
+        "-pix_fmt", "yuv420p",
+        str(output_path),
+    ]
+    try:
+        return subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=stderr,
+        )
+    except OSError as e:
+        raise RuntimeError(f"Failed to start ffmpeg encoder for: {output_path}") from e
+
+
+def _decode_stderr(stderr: IO[bytes]) -> str:
+    """Return the tail of ffmpeg's stderr file for error messages."""
+    stderr.seek(0)
+    text = stderr.read().decode("utf-8", errors="replace").strip()
+    return text[-500:] if text else "unknown error"
 
 
 def _draw_text_outlined(
@@ -83,14 +159,6 @@ class Exporter:
             self._frame_cache.put(entry.video_id, frame_idx, frame)
         return frame
 
-    def _get_reference_frame(
-        self, ref_video_id: int, frame_idx: int, videos: list[VideoEntry]
-    ) -> np.ndarray | None:
-        for v in videos:
-            if v.video_id == ref_video_id:
-                return self._get_frame(v, frame_idx)
-        return None
-
     def export(
         self,
         output_path: str | Path,
@@ -149,101 +217,219 @@ class Exporter:
         panel_width = max(1, panel_width)
         panel_height = max(1, panel_height)
 
-        use_audio = audio_source_path is not None and Path(audio_source_path).exists()
-        final_output = output_path
+        if audio_source_path is not None and not Path(audio_source_path).exists():
+            audio_source_path = None
 
-        if use_audio:
-            with tempfile.NamedTemporaryFile(
-                suffix=".mp4", prefix="export_", delete=False
-            ) as tmp:
-                write_path = Path(tmp.name)
-        else:
-            write_path = output_path
-
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-        writer = cv2.VideoWriter(
-            str(write_path), fourcc, fps, (canvas_width, canvas_height)
-        )
-        if not writer.isOpened():
-            raise RuntimeError(f"Failed to create VideoWriter for: {write_path}")
+        encoder_log = tempfile.TemporaryFile()
+        try:
+            encoder = _open_encoder(
+                output_path, canvas_width, canvas_height, fps, encoder_log,
+                audio_source_path,
+            )
+        except BaseException:
+            encoder_log.close()
+            raise
 
         label_font_scale = max(0.4, min(1.2, panel_height / 500.0))
         label_thickness = max(1, round(panel_height / 500))
         frame_num_scale = max(0.4, min(1.0, canvas_height / 600.0))
         frame_num_thickness = max(1, round(canvas_height / 600))
 
+        # Tiles never move, so the canvas is allocated once and each panel is
+        # rendered straight into its fixed slice instead of re-zeroing the
+        # whole canvas every frame.
+        canvas = np.zeros((canvas_height, canvas_width, 3), dtype=np.uint8)
+        panel_buffers: list[np.ndarray] = []
+        for i in range(video_count):
+            y0 = (i // cols) * panel_height
+            x0 = (i % cols) * panel_width
+            panel_buffers.append(
+                canvas[y0 : y0 + panel_height, x0 : x0 + panel_width]
+            )
+
+        # The frame-number overlay is the only thing drawn outside the panel
+        # slices; blank its bounding box (sized for the widest label) per frame.
+        frame_num_org = (10, int(frame_num_scale * 30) + 4)
+        (fn_w, fn_h), fn_base = cv2.getTextSize(
+            f"Frame: {max(0, total_frames - 1)}", cv2.FONT_HERSHEY_SIMPLEX,
+            frame_num_scale, frame_num_thickness + 1,
+        )
+        fn_y0 = max(0, frame_num_org[1] - fn_h - 2)
+        fn_y1 = min(canvas_height, frame_num_org[1] + fn_base + 2)
+        fn_x0 = max(0, frame_num_org[0] - 2)
+        fn_x1 = min(canvas_width, frame_num_org[0] + fn_w + 2)
+        frame_num_band = (slice(fn_y0, fn_y1), slice(fn_x0, fn_x1))
+
+        # The counter is rasterised into a small scratch sprite plus a coverage
+        # mask (text and outline) and blitted, so putText never touches the
+        # full canvas.
+        fn_sprite = np.zeros((fn_y1 - fn_y0, fn_x1 - fn_x0, 3), dtype=np.uint8)
+        fn_mask = np.zeros(fn_sprite.shape[:2], dtype=np.uint8)
+        fn_sprite_org = (frame_num_org[0] - fn_x0, frame_num_org[1] - fn_y0)
+
+        # Export is a pure sequential scan, so frames are streamed from an
+        # ffmpeg rawvideo pipe per video; videos whose pipe cannot be opened,
+        # or yields no frame at all, fall back to the VideoCapture path.
+        streams: dict[int, Iterator[np.ndarray]] = {}
+        for e in videos:
+            try:
+                streams[e.video_id] = e.open_sequential_stream()
+            except (OSError, ValueError):
+                pass
+
+        def fetch(entry: VideoEntry, idx: int) -> np.ndarray | None:
+            stream = streams.get(entry.video_id)
+            if stream is None:
+                return self._get_frame(entry, idx)
+            frame = next(stream, None)
+            if frame is None:
+                # Only possible before the first frame: once one was decoded
+                # the stream repeats it past the end.
+                del streams[entry.video_id]
+                stream.close()
+                return self._get_frame(entry, idx)
+            return frame
+
+        # Decoders are independent, so each video's next frame is decoded on a
+        # worker thread while the current one is composed. Every decoder is
+        # only ever touched by its own pending future; the compose step reads
+        # the resolved frames (including reference frames) from `frames`.
+        decode_pool = ThreadPoolExecutor(max_workers=video_count)
+
+        def prefetch(idx: int) -> list[Future]:
+            return [decode_pool.submit(fetch, e, idx) for e in videos]
+
+        # The ROI is fixed for the whole export, so crop slices are computed
+        # once per frame size (normally one per video) instead of per frame.
+        crop_slices: dict[tuple[int, int], tuple[slice, slice]] = {
+            (e.info.height, e.info.width): _roi_slices(roi, e.info.width, e.info.height)
+            for e in videos
+        }
+
+        def crop(frame: np.ndarray) -> np.ndarray:
+            if roi is None:
+                return frame
+            h, w = frame.shape[:2]
+            slices = crop_slices.get((h, w))
+            if slices is None:
+                slices = crop_slices.setdefault((h, w), _roi_slices(roi, w, h))
+            return frame[slices]
+
+        # Labels, font scale and thickness are fixed for the export, so the
+        # centred label origin is measured once per video.
+        label_y = int(label_font_scale * 30) + 4
+        label_layouts: list[tuple[str, tuple[int, int]]] = []
+        for entry in videos:
+            (txt_w, _), _ = cv2.getTextSize(
+                entry.label, cv2.FONT_HERSHEY_SIMPLEX,
+                label_font_scale, label_thickness,
+            )
+            label_layouts.append((entry.label, ((panel_width - txt_w) // 2, label_y)))
+
+        # Per-video filter destinations, allocated on first use and reused so
+        # filters write in place and the panel resize reads straight from them.
+        filter_out: dict[int, np.ndarray] = {}
+
+        def filter_buffer(video_id: int, like: np.ndarray) -> np.ndarray:
+            buf = filter_out.get(video_id)
+            if buf is None or buf.shape != like.shape or buf.dtype != like.dtype:
+                buf = np.empty_like(like)
+                filter_out[video_id] = buf
+            return buf
+
+        def render_panel(
+            entry: VideoEntry,
+            panel: np.ndarray,
+            label_layout: tuple[str, tuple[int, int]],
+            frames: dict[int, np.ndarray | None],
+        ) -> None:
+            frame = frames[entry.video_id]
+            if frame is None:
+                frame = np.zeros((panel_height, panel_width, 3), dtype=np.uint8)
+
+            frame = crop(frame)
+
+            if entry.filter is not None:
+                flt: BaseFilter = entry.filter
+                ref_frame = None
+                if flt.needs_reference:
+                    ref_video_id = getattr(flt, "ref_video_id", None)
+                    if ref_video_id is not None:
+                        ref_frame = frames.get(ref_video_id)
+                        ref_frame = crop(ref_frame) if ref_frame is not None else None
+                frame = flt.apply(
+                    frame, ref_frame, out=filter_buffer(entry.video_id, frame)
+                )
+
+            resize_with_letterbox(frame, panel_width, panel_height, out=panel)
+
+            label, label_org = label_layout
+            _draw_text_outlined(
+                panel, label, label_org, label_font_scale, label_thickness
+            )
+
+        # Panels are independent and write to disjoint canvas slices, and the
+        # OpenCV calls doing the work release the GIL, so they render in
+        # parallel and are joined before the canvas is written.
+        render_pool = ThreadPoolExecutor(max_workers=min(video_count, os.cpu_count() or 1))
+
         try:
+            pending = prefetch(0) if total_frames > 0 else []
             for frame_idx in range(total_frames):
-                canvas = np.zeros((canvas_height, canvas_width, 3), dtype=np.uint8)
-
-                for i, entry in enumerate(videos):
-                    frame = self._get_frame(entry, frame_idx)
-                    if frame is None:
-                        frame = np.zeros((panel_height, panel_width, 3), dtype=np.uint8)
-
-                    frame = _crop_to_roi(frame, roi)
-
-                    if entry.filter is not None:
-                        flt: BaseFilter = entry.filter
-                        ref_frame = None
-                        if flt.needs_reference:
-                            ref_video_id = getattr(flt, "ref_video_id", None)
-                            if ref_video_id is not None:
-                                ref_frame = self._get_reference_frame(
-                                    ref_video_id, frame_idx, videos
-                                )
-                                ref_frame = _crop_to_roi(ref_frame, roi) if ref_frame is not None else None
-                        frame = flt.apply(frame, ref_frame)
-
-                    panel = resize_with_letterbox(frame, panel_width, panel_height)
-
-                    (txt_w, _), _ = cv2.getTextSize(
-                        entry.label, cv2.FONT_HERSHEY_SIMPLEX,
-                        label_font_scale, label_thickness,
-                    )
-                    label_x = (panel_width - txt_w) // 2
-                    label_y = int(label_font_scale * 30) + 4
-                    _draw_text_outlined(
-                        panel, entry.label, (label_x, label_y),
-                        label_font_scale, label_thickness,
-                    )
+                frames = {e.video_id: f.result() for e, f in zip(videos, pending)}
+                if frame_idx + 1 < total_frames:
+                    pending = prefetch(frame_idx + 1)
 
-                    row_idx = i // cols
-                    col_idx = i % cols
-                    y0 = row_idx * panel_height
-                    x0 = col_idx * panel_width
-                    canvas[y0 : y0 + panel_height, x0 : x0 + panel_width] = panel
+                canvas[frame_num_band] = 0
+
+                rendering = [
+                    render_pool.submit(
+                        render_panel, entry, panel_buffers[i], label_layouts[i], frames
+                    )
+                    for i, entry in enumerate(videos)
+                ]
+                for f in rendering:
+                    f.result()
 
                 frame_label = f"Frame: {frame_idx}"
+                fn_sprite.fill(0)
+                fn_mask.fill(0)
                 _draw_text_outlined(
-                    canvas, frame_label, (10, int(frame_num_scale * 30) + 4),
+                    fn_sprite, frame_label, fn_sprite_org,
                     frame_num_scale, frame_num_thickness,
                 )
+                cv2.putText(
+                    fn_mask, frame_label, fn_sprite_org, cv2.FONT_HERSHEY_SIMPLEX,
+                    frame_num_scale, 255, frame_num_thickness + 1, cv2.LINE_AA,
+                )
+                np.copyto(canvas[frame_num_band], fn_sprite, where=fn_mask[..., None] > 0)
 
-                writer.write(canvas)
+                try:
+                    encoder.stdin.write(canvas.data)
+                except BrokenPipeError:
+                    encoder.communicate()
+                    raise RuntimeError(
+                        f"ffmpeg encoder exited early: {_decode_stderr(encoder_log)}"
+                    ) from None
 
                 if progress_callback is not None:
                     progress_callback(frame_idx, total_frames)
 
+        except BaseException:
+            if encoder.returncode is None:
+                encoder.kill()
+                encoder.communicate()
+            encoder_log.close()
+            raise
         finally:
-            writer.release()
+            render_pool.shutdown(wait=True, cancel_futures=True)
+            decode_pool.shutdown(wait=True, cancel_futures=True)
+            for stream in streams.values():
+                stream.close()
 
-        if use_audio:
-            try:
-                subprocess.run(
-                    [
-                        "ffmpeg", "-y",
-                        "-i", str(write_path),
-                        "-i", str(audio_source_path),
-                        "-c:v", "copy",
-                        "-c:a", "aac",
-                        "-shortest",
-                        str(final_output),
-                    ],
-                    capture_output=True,
-                    timeout=300,
-                    check=True,
-                )
-            finally:
-                if write_path.exists():
-                    write_path.unlink()
+        encoder.communicate()
+        try:
+            if encoder.returncode != 0:
+                raise RuntimeError(f"ffmpeg encoding failed: {_decode_stderr(encoder_log)}")
+        finally:
+            encoder_log.close()
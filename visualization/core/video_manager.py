@@ -1,16 +1,47 @@
 """Video manager module for video visualization tool."""
 
 from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
+from typing import IO
+import asyncio
+import logging
+import os
 import subprocess
+import tempfile
+import threading
+import time
 
 import cv2
 import numpy as np
 
 from visualization.filters.base import BaseFilter
 
+logger = logging.getLogger(__name__)
+
 FPS_TOLERANCE = 0.01
+MAX_OPEN_CAPTURES = 8
+CAPTURE_IDLE_SEC = 2.0  # captures used more recently are never evicted
+FFPROBE_TIMEOUT_SEC = 10
+FRAME_CACHE_LOCK_SHARDS = 64  # power of two; FrameCache picks a shard by video_id
+
+
+def _ffprobe_audio_cmd(path: Path) -> list[str]:
+    """ffprobe command line listing the codec type of every audio stream."""
+    return [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "a",
+        "-show_entries",
+        "stream=codec_type",
+        "-of",
+        "csv=p=0",
+        str(path),
+    ]
 
 
 def _detect_audio_ffprobe(path: Path) -> bool:
@@ -25,21 +56,10 @@ def _detect_audio_ffprobe(path: Path) -> bool:
     """
     try:
         result = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "error",
-                "-select_streams",
-                "a",
-                "-show_entries",
-                "stream=codec_type",
-                "-of",
-                "csv=p=0",
-                str(path),
-            ],
+            _ffprobe_audio_cmd(path),
             capture_output=True,
             text=True,
-            timeout=10,
+            timeout=FFPROBE_TIMEOUT_SEC,
             check=False,
         )
         if result.returncode != 0:
@@ -52,6 +72,79 @@ def _detect_audio_ffprobe(path: Path) -> bool:
         return False
 
 
+async def _detect_audio_ffprobe_async(path: Path) -> bool:
+    """Asynchronous variant of _detect_audio_ffprobe with the same semantics."""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *_ffprobe_audio_cmd(path),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except FileNotFoundError:
+        return False
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(), FFPROBE_TIMEOUT_SEC)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        return False
+    if proc.returncode != 0:
+        return False
+    return "audio" in stdout.decode("utf-8", errors="replace")
+
+
+async def _detect_audio_batch(paths: Sequence[Path]) -> list[bool]:
+    """Run one ffprobe audio check per path concurrently."""
+    return list(await asyncio.gather(*(_detect_audio_ffprobe_async(p) for p in paths)))
+
+
+def _iter_raw_frames(
+    proc: subprocess.Popen, width: int, height: int, stderr: IO[bytes], source: Path
+) -> Iterator[np.ndarray]:
+    """Yield (height, width, 3) uint8 frames read from proc's rawvideo stdout.
+
+    stderr is the file ffmpeg writes its diagnostics to; they are logged if
+    the decode fails or produces no frames.
+    """
+    frame_bytes = width * height * 3
+    last: np.ndarray | None = None
+    try:
+        while True:
+            frame = np.empty((height, width, 3), dtype=np.uint8)
+            buf = memoryview(frame).cast("B")
+            got = 0
+            while got < frame_bytes:
+                n = proc.stdout.readinto(buf[got:])
+                if not n:
+                    break
+                got += n
+            if got < frame_bytes:
+                break
+            last = frame
+            yield frame
+        proc.wait()
+        if proc.returncode != 0 or last is None:
+            stderr.seek(0)
+            err = stderr.read().decode("utf-8", errors="replace").strip()
+            logger.warning(
+                "ffmpeg decode of %s %s: %s",
+                source,
+                "produced no frames" if last is None else f"failed ({proc.returncode})",
+                err[-500:] or "no error output",
+            )
+        if last is None:
+            return
+        while True:
+            yield last
+    finally:
+        proc.stdout.close()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        stderr.close()
+
+
 @dataclass
 class VideoInfo:
     """Metadata for a loaded video."""
@@ -82,22 +175,43 @@ class VideoEntry:
         self.filter = filter
         self._capture: cv2.VideoCapture | None = None
         self._next_frame_idx: int = 0
+        # Guards _capture; held for the duration of every decode.
+        self._capture_lock = threading.Lock()
+        # Set by VideoManager, which bounds the number of open captures.
+        self._manager: VideoManager | None = None
+        # time.monotonic() of the last decode; maintained by VideoManager.
+        self._capture_last_used = 0.0
 
     def _ensure_capture(self) -> cv2.VideoCapture | None:
-        """Ensure the video capture is opened. Return None if failed."""
+        """Ensure the video capture is opened. Return None if failed.
+
+        Must be called with _capture_lock held.
+        """
         if self._capture is not None:
+            if self._manager is not None:
+                self._manager._capture_used(self)
             return self._capture
         cap = cv2.VideoCapture(str(self.info.path))
         if not cap.isOpened():
             return None
         self._capture = cap
         self._next_frame_idx = 0
+        if self._manager is not None:
+            self._manager._capture_opened(self)
         return cap
 
+    def _release_capture(self) -> None:
+        """Release the capture. Must be called with _capture_lock held."""
+        if self._capture is not None:
+            self._capture.release()
+            self._next_frame_idx = 0
+            self._capture = None
+
     @property
     def capture(self) -> cv2.VideoCapture:
         """Opened cv2.VideoCapture handle."""
-        cap = self._ensure_capture()
+        with self._capture_lock:
+            cap = self._ensure_capture()
         if cap is None:
             raise RuntimeError(
                 f"Failed to open video: {self.info.path}"
@@ -110,25 +224,106 @@ class VideoEntry:
         If frame_idx exceeds the video's frame count the last frame is returned.
         Avoids costly seek when the requested frame is already the next in sequence.
         """
-        cap = self._ensure_capture()
-        if cap is None:
-            return None
-        clamped = min(frame_idx, max(0, self.info.frame_count - 1))
-        if clamped != self._next_frame_idx:
-            cap.set(cv2.CAP_PROP_POS_FRAMES, clamped)
-        ret, frame = cap.read()
-        if not ret or frame is None:
-            self._next_frame_idx = -1
-            return None
-        self._next_frame_idx = clamped + 1
-        return frame
+        with self._capture_lock:
+            cap = self._ensure_capture()
+            if cap is None:
+                return None
+            clamped = min(frame_idx, max(0, self.info.frame_count - 1))
+            if clamped != self._next_frame_idx:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, clamped)
+            ret, frame = cap.read()
+            if not ret or frame is None:
+                self._next_frame_idx = -1
+                return None
+            self._next_frame_idx = clamped + 1
+            return frame
+
+    def open_sequential_stream(self) -> Iterator[np.ndarray]:
+        """Decode the whole video front to back through an ffmpeg rawvideo pipe.
+
+        Intended for linear scans such as export; random access (scrubbing) keeps
+        using read_frame. Every yielded BGR frame is a fresh array, so it stays
+        valid while the next one is decoded. Once the video is exhausted its last
+        frame is repeated, mirroring read_frame's clamping; if ffmpeg yields no
+        frame at all the generator ends immediately. Close the returned
+        generator to terminate ffmpeg.
+
+        Raises:
+            ValueError: If the frame size is unknown, or the video carries a
+                display rotation, so ffmpeg's frames would not match the
+                frames and size reported by VideoCapture.
+            OSError: If ffmpeg cannot be started (e.g. not on PATH).
+        """
+        w, h = self.info.width, self.info.height
+        if w <= 0 or h <= 0:
+            raise ValueError(f"Unknown frame size for {self.info.path}")
+        with self._capture_lock:
+            cap = self._ensure_capture()
+            rotation = int(cap.get(cv2.CAP_PROP_ORIENTATION_META)) if cap is not None else 0
+        if rotation % 360:
+            raise ValueError(f"{self.info.path} is rotated by {rotation} degrees")
+        stderr = tempfile.TemporaryFile()
+        try:
+            proc = subprocess.Popen(
+                [
+                    "ffmpeg",
+                    "-v",
+                    "error",
+                    "-nostdin",
+                    # Keep the coded frame size, which is what w and h describe.
+                    "-noautorotate",
+                    "-i",
+                    str(self.info.path),
+                    "-an",
+                    "-f",
+                    "rawvideo",
+                    "-pix_fmt",
+                    "bgr24",
+                    "pipe:1",
+                ],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                # A file rather than a pipe, so a chatty decoder can never block
+                # on a full stderr buffer while stdout is being read.
+                stderr=stderr,
+                bufsize=w * h * 3 * 4,
+            )
+        except BaseException:
+            stderr.close()
+            raise
+        return _iter_raw_frames(proc, w, h, stderr, self.info.path)
 
     def close(self) -> None:
         """Release the capture."""
-        if self._capture is not None:
-            self._capture.release()
-            self._next_frame_idx = 0
-            self._capture = None
+        with self._capture_lock:
+            self._release_capture()
+        if self._manager is not None:
+            self._manager._capture_closed(self)
+
+
+def _open_video(path: Path) -> tuple[cv2.VideoCapture, int, int, float, int]:
+    """Open path and read its metadata; thread-safe, touches no manager state.
+
+    Returns (capture, width, height, fps, frame_count) with fps and
+    frame_count clamped to 0 when the container does not report them.
+    """
+    if not path.exists():
+        raise FileNotFoundError(f"Video file not found: {path}")
+
+    cap = cv2.VideoCapture(str(path))
+    if not cap.isOpened():
+        cap.release()
+        raise RuntimeError(f"Cannot open video file: {path}")
+
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    if fps <= 0 or not np.isfinite(fps):
+        fps = 0.0
+    if frame_count < 0:
+        frame_count = 0
+    return cap, width, height, fps, frame_count
 
 
 class VideoManager:
@@ -136,42 +331,75 @@ class VideoManager:
 
     def __init__(self) -> None:
         self._entries: list[VideoEntry] = []
+        self._by_id: dict[int, VideoEntry] = {}  # mirrors _entries
         self._next_id = 0
+        # Entries with an open capture, least recently used first. Captures
+        # beyond max_open_captures are released and reopened on demand, but
+        # only once idle for CAPTURE_IDLE_SEC: when more videos than that are
+        # being painted or played, all of their captures stay open.
+        self.max_open_captures = MAX_OPEN_CAPTURES
+        self._open_captures: OrderedDict[int, VideoEntry] = OrderedDict()
+        self._open_captures_lock = threading.Lock()
 
     def load_video(self, path: str | Path) -> VideoEntry:
         """Open video with cv2.VideoCapture, probe metadata, and add to session."""
-        path = Path(path).resolve()
-        if not path.exists():
-            raise FileNotFoundError(f"Video file not found: {path}")
+        return self._load_video(Path(path).resolve())
 
-        cap = cv2.VideoCapture(str(path))
-        if not cap.isOpened():
-            cap.release()
-            raise RuntimeError(f"Cannot open video file: {path}")
+    def load_videos(
+        self, paths: Sequence[str | Path]
+    ) -> list[VideoEntry | ValueError | FileNotFoundError | RuntimeError]:
+        """Load several videos, opening them and probing their audio concurrently.
 
-        try:
-            width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-            height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        Captures are opened on a thread pool while the ffprobe audio checks run,
+        then videos are added in the given order with the same checks as
+        load_video. Returns one item per path: the new entry, or the exception
+        load_video would have raised for it.
+        """
+        resolved = [Path(p).resolve() for p in paths]
+        if not resolved:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(resolved))) as pool:
+            opening = [pool.submit(_open_video, p) for p in resolved]
+            existing = [p for p in resolved if p.exists()]
+            has_audio = dict(zip(existing, asyncio.run(_detect_audio_batch(existing))))
+
+            # Adding stays sequential: ids, the session fps check and the open
+            # capture bookkeeping all depend on the order of _entries.
+            results: list[VideoEntry | ValueError | FileNotFoundError | RuntimeError] = []
+            for path, future in zip(resolved, opening):
+                try:
+                    results.append(
+                        self._add_video(path, future.result(), has_audio.get(path))
+                    )
+                except (ValueError, FileNotFoundError, RuntimeError) as e:
+                    results.append(e)
+        return results
 
-            if fps <= 0 or not np.isfinite(fps):
-                fps = 0.0
-            if frame_count < 0:
-                frame_count = 0
+    def _load_video(self, path: Path, has_audio: bool | None = None) -> VideoEntry:
+        """Open and add a resolved path; probe audio unless has_audio is given."""
+        return self._add_video(path, _open_video(path), has_audio)
 
+    def _add_video(
+        self,
+        path: Path,
+        opened: tuple[cv2.VideoCapture, int, int, float, int],
+        has_audio: bool | None = None,
+    ) -> VideoEntry:
+        """Add a capture opened by _open_video; takes ownership of it."""
+        cap, width, height, fps, frame_count = opened
+        try:
             duration_sec = frame_count / fps if fps > 0 else 0.0
 
             if self._entries:
                 existing_fps = self._entries[0].info.fps
                 if abs(fps - existing_fps) > FPS_TOLERANCE:
-                    cap.release()
                     raise ValueError(
                         f"Video fps ({fps}) does not match session fps ({existing_fps}). "
                         "All videos must have the same framerate (tolerance 0.01)."
                     )
 
-            has_audio = _detect_audio_ffprobe(path)
+            if has_audio is None:
+                has_audio = _detect_audio_ffprobe(path)
             filename = path.name
 
             info = VideoInfo(
@@ -188,35 +416,76 @@ class VideoManager:
             video_id = self._next_id
             self._next_id += 1
             entry = VideoEntry(video_id=video_id, info=info)
+            entry._manager = self
             entry._capture = cap
             self._entries.append(entry)
+            self._by_id[video_id] = entry
+            with entry._capture_lock:
+                self._capture_opened(entry)
             return entry
         except Exception:
             cap.release()
             raise
 
+    def _capture_opened(self, entry: VideoEntry) -> None:
+        """Track entry's newly opened capture and evict idle, least recently used ones.
+
+        Called with entry._capture_lock held. Victims currently decoding on
+        another thread are skipped rather than waited for, so two entries
+        opening at once can never deadlock on each other's locks.
+        """
+        now = time.monotonic()
+        with self._open_captures_lock:
+            entry._capture_last_used = now
+            self._open_captures[entry.video_id] = entry
+            self._open_captures.move_to_end(entry.video_id)
+            excess = len(self._open_captures) - self.max_open_captures
+            for video_id, victim in list(self._open_captures.items()):
+                if excess <= 0 or victim is entry:
+                    break
+                if now - victim._capture_last_used < CAPTURE_IDLE_SEC:
+                    break  # the rest were used even more recently
+                if not victim._capture_lock.acquire(blocking=False):
+                    continue
+                try:
+                    victim._release_capture()
+                finally:
+                    victim._capture_lock.release()
+                del self._open_captures[video_id]
+                excess -= 1
+
+    def _capture_used(self, entry: VideoEntry) -> None:
+        """Mark entry's open capture as most recently used."""
+        now = time.monotonic()
+        with self._open_captures_lock:
+            if entry.video_id in self._open_captures:
+                entry._capture_last_used = now
+                self._open_captures.move_to_end(entry.video_id)
+
+    def _capture_closed(self, entry: VideoEntry) -> None:
+        """Stop tracking entry's capture after it was released."""
+        with self._open_captures_lock:
+            self._open_captures.pop(entry.video_id, None)
+
     def remove_video(self, video_id: int) -> None:
         """Close and remove video by ID."""
-        for i, entry in enumerate(self._entries):
-            if entry.video_id == video_id:
-                entry.close()
-                self._entries.pop(i)
-                return
-        raise KeyError(f"Video with id {video_id} not found")
+        entry = self._by_id.pop(video_id, None)
+        if entry is None:
+            raise KeyError(f"Video with id {video_id} not found")
+        entry.close()
+        self._entries.remove(entry)
 
     def clear(self) -> None:
         """Close and remove all videos."""
         for entry in self._entries:
             entry.close()
         self._entries.clear()
+        self._by_id.clear()
         self._next_id = 0
 
     def get_video(self, video_id: int) -> VideoEntry | None:
         """Get video entry by ID."""
-        for entry in self._entries:
-            if entry.video_id == video_id:
-                return entry
-        return None
+        return self._by_id.get(video_id)
 
     def get_all_videos(self) -> list[VideoEntry]:
         """Get all loaded video entries."""
@@ -251,8 +520,32 @@ class VideoManager:
         return (max_w, max_h)
 
 
+class _FrameSlab:
+    """Per-video frame storage: one contiguous preallocated block of slots."""
+
+    def __init__(self, max_size: int, frame_shape: tuple[int, ...], dtype: np.dtype) -> None:
+        self.slab = np.empty((max_size, *frame_shape), dtype=dtype)
+        # frame_idx -> slot. Insertion order is the LRU order, oldest first:
+        # a hit re-inserts its key, so bump and evict are both O(1) plain
+        # dict operations.
+        self.index_map: dict[int, int] = {}
+
+
 class FrameCache:
-    """LRU cache for decoded frames to enable fast scrubbing."""
+    """LRU cache for decoded frames to enable fast scrubbing.
+
+    Each video's frames live in a single (max_size, H, W, 3) array sized lazily
+    from the first frame put. put() copies the frame into its slot, so callers
+    may keep using or mutating their own array; get() returns a read-only view
+    into the slab. A returned view is only valid until its slot is evicted,
+    i.e. until max_size other frames of the same video have been put.
+
+    prefetch() decodes upcoming frames on background threads so sequential
+    playback finds them already cached; all cache methods are thread-safe.
+    Each video's slab is guarded by one of FRAME_CACHE_LOCK_SHARDS locks chosen
+    by video_id, so threads working on different videos (canvas panels,
+    prefetch workers) do not serialise on each other's frame copies.
+    """
 
     def __init__(self, max_size: int = 120) -> None:
         """Initialize the cache.
@@ -261,42 +554,156 @@ class FrameCache:
             max_size: Maximum number of frames to cache per video.
         """
         self._max_size = max_size
-        self._cache: dict[int, OrderedDict[int, np.ndarray]] = {}
-
-    def _get_video_cache(self, video_id: int) -> OrderedDict[int, np.ndarray]:
-        """Get or create the per-video LRU cache."""
-        if video_id not in self._cache:
-            self._cache[video_id] = OrderedDict()
-        return self._cache[video_id]
+        self._cache: dict[int, _FrameSlab] = {}
+        # Entries of _cache are added, removed and used under their video's
+        # shard lock. _lock guards the prefetch state below and may be held
+        # while taking a shard lock, never the other way round.
+        self._shard_locks = [threading.Lock() for _ in range(FRAME_CACHE_LOCK_SHARDS)]
+        self._lock = threading.Lock()
+        self._prefetch_pool: ThreadPoolExecutor | None = None
+        # video_id -> worker / target window [start, stop); guarded by _lock.
+        self._prefetch_jobs: dict[int, Future] = {}
+        self._prefetch_ranges: dict[int, tuple[int, int]] = {}
+        self._prefetch_generation = 0
+
+    def _shard_lock(self, video_id: int) -> threading.Lock:
+        return self._shard_locks[video_id & (FRAME_CACHE_LOCK_SHARDS - 1)]
+
+    def _get_video_cache(self, video_id: int, frame: np.ndarray) -> _FrameSlab | None:
+        """Get or create the per-video slab. None if frame does not fit it."""
+        video_cache = self._cache.get(video_id)
+        if video_cache is None:
+            video_cache = _FrameSlab(self._max_size, frame.shape, frame.dtype)
+            self._cache[video_id] = video_cache
+        elif video_cache.slab.shape[1:] != frame.shape or video_cache.slab.dtype != frame.dtype:
+            return None
+        return video_cache
 
     def get(self, video_id: int, frame_idx: int) -> np.ndarray | None:
         """Get a cached frame if present."""
-        video_cache = self._cache.get(video_id)
-        if video_cache is None or frame_idx not in video_cache:
-            return None
-        frame = video_cache[frame_idx]
-        video_cache.move_to_end(frame_idx)
-        return frame
+        with self._shard_lock(video_id):
+            video_cache = self._cache.get(video_id)
+            if video_cache is None:
+                return None
+            index_map = video_cache.index_map
+            slot = index_map.pop(frame_idx, None)
+            if slot is None:
+                return None
+            index_map[frame_idx] = slot
+            frame = video_cache.slab[slot]
+            frame.flags.writeable = False
+            return frame
 
     def put(self, video_id: int, frame_idx: int, frame: np.ndarray) -> None:
         """Cache a decoded frame. Evict oldest for this video if at capacity."""
-        video_cache = self._get_video_cache(video_id)
-
-        if frame_idx in video_cache:
-            video_cache.move_to_end(frame_idx)
-            video_cache[frame_idx] = frame
-            return
+        with self._shard_lock(video_id):
+            video_cache = self._get_video_cache(video_id, frame)
+            if video_cache is None:
+                return
 
-        while len(video_cache) >= self._max_size:
-            video_cache.popitem(last=False)
+            index_map = video_cache.index_map
+            slot = index_map.pop(frame_idx, None)
+            if slot is None:
+                if len(index_map) < self._max_size:
+                    slot = len(index_map)
+                else:
+                    slot = index_map.pop(next(iter(index_map)))
 
-        video_cache[frame_idx] = frame
+            np.copyto(video_cache.slab[slot], frame)
+            index_map[frame_idx] = slot
 
     def clear(self, video_id: int | None = None) -> None:
         """Clear cache for a specific video or all videos."""
-        if video_id is None:
-            self._cache.clear()
+        if video_id is not None:
+            with self._shard_lock(video_id):
+                self._cache.pop(video_id, None)
             return
+        for vid in list(self._cache):
+            with self._shard_lock(vid):
+                self._cache.pop(vid, None)
+
+    def prefetch(self, entries: Sequence[VideoEntry], start: int, count: int) -> None:
+        """Decode frames [start, start + count) of each entry in the background.
 
-        if video_id in self._cache:
-            del self._cache[video_id]
+        Frames already cached are skipped. Each video has at most one worker,
+        reading front to back so read_frame never has to seek; calling again
+        while it runs just moves its target window. Use cancel_prefetch() to
+        stop all workers.
+        """
+        count = min(count, self._max_size)
+        if count <= 0:
+            return
+        with self._lock:
+            if self._prefetch_pool is None:
+                self._prefetch_pool = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    thread_name_prefix="frame-prefetch",
+                )
+            for entry in entries:
+                stop = min(start + count, max(1, entry.info.frame_count))
+                self._prefetch_ranges[entry.video_id] = (start, stop)
+                if entry.video_id not in self._prefetch_jobs:
+                    self._prefetch_jobs[entry.video_id] = self._prefetch_pool.submit(
+                        self._prefetch_video, entry, self._prefetch_generation
+                    )
+
+    def _prefetch_video(self, entry: VideoEntry, generation: int) -> None:
+        video_id = entry.video_id
+        frame_idx = 0
+        last_start = -1
+        # True once this worker's registration is gone: cancelled, or
+        # deregistered by the worker itself while holding the lock.
+        deregistered = False
+        try:
+            while True:
+                with self._lock:
+                    window = self._prefetch_ranges.get(video_id)
+                    if window is None or generation != self._prefetch_generation:
+                        deregistered = True
+                        return
+                    start, stop = window
+                    if start > frame_idx or start < last_start:
+                        frame_idx = start
+                    last_start = start
+                    with self._shard_lock(video_id):
+                        video_cache = self._cache.get(video_id)
+                        if video_cache is not None:
+                            while frame_idx < stop and frame_idx in video_cache.index_map:
+                                frame_idx += 1
+                    if frame_idx >= stop:
+                        # Deregister under the lock so a concurrent prefetch() call
+                        # either sees this worker's window or starts a new worker.
+                        del self._prefetch_ranges[video_id]
+                        del self._prefetch_jobs[video_id]
+                        deregistered = True
+                        return
+                frame = entry.read_frame(frame_idx)
+                if frame is None:
+                    return
+                self.put(video_id, frame_idx, frame)
+                frame_idx += 1
+        except Exception:
+            logger.exception("Prefetching frames of video %d failed", video_id)
+        finally:
+            # On a failed decode or an exception the registration is still
+            # this worker's (prefetch() only submits a new one once it is
+            # gone); drop it so the next prefetch() can restart the video.
+            if not deregistered:
+                with self._lock:
+                    if generation == self._prefetch_generation:
+                        self._prefetch_ranges.pop(video_id, None)
+                        self._prefetch_jobs.pop(video_id, None)
+
+    def cancel_prefetch(self) -> None:
+        """Stop background prefetching and wait for in-flight decodes to finish.
+
+        Call before closing videos so no worker reopens a released capture.
+        """
+        with self._lock:
+            self._prefetch_generation += 1
+            jobs = list(self._prefetch_jobs.values())
+            self._prefetch_jobs.clear()
+            self._prefetch_ranges.clear()
+        for job in jobs:
+            job.cancel()
+        wait(jobs)
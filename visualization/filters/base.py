@@ -1,9 +1,12 @@
 """Abstract base class for video visualization filters."""
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 import numpy as np
-from PySide6.QtWidgets import QWidget
+
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QWidget
 
 
 class BaseFilter(ABC):
@@ -20,24 +23,35 @@ class BaseFilter(ABC):
         """
         pass
 
-    def get_config_ui(self) -> QWidget:
+    def get_config_ui(self) -> "QWidget":
         """Return a Qt widget for the configuration panel in the filter dialog.
 
-        Base implementation returns an empty QWidget.
+        Base implementation returns an empty QWidget. Qt is imported here, not
+        at module level, so headless export does not load PySide6.
         """
+        from PySide6.QtWidgets import QWidget
+
         return QWidget()
 
     @abstractmethod
     def apply(
-        self, frame: np.ndarray, ref_frame: np.ndarray | None = None
+        self,
+        frame: np.ndarray,
+        ref_frame: np.ndarray | None = None,
+        out: np.ndarray | None = None,
     ) -> np.ndarray:
         """Process a frame and return the result.
 
         Args:
             frame: Input frame as BGR uint8 numpy array (H, W, 3).
             ref_frame: Optional reference frame for filters that need it (same format).
+            out: Optional preallocated destination (same shape and dtype as frame).
+                Filters should write their result into it when they can; callers
+                must use the returned array, which need not be out.
 
         Returns:
-            Processed frame as BGR uint8 numpy array (same shape as frame).
+            Processed frame as BGR uint8 numpy array (same shape as frame). It may
+            be frame itself when there is nothing to do, so callers must treat the
+            result as read-only.
         """
         ...
@@ -1,11 +1,24 @@
 """Difference heatmap filter for visualizing pixel differences between frames."""
 
+import logging
+import threading
+from typing import TYPE_CHECKING
+
 import cv2
 import numpy as np
-from PySide6.QtWidgets import QComboBox, QFormLayout, QWidget
 
 from .base import BaseFilter
 
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QWidget
+
+try:
+    import numba
+except ImportError:  # optional: fall back to the OpenCV path
+    numba = None
+
+logger = logging.getLogger(__name__)
+
 COLORMAP_OPTIONS = [
     ("JET", cv2.COLORMAP_JET),
     ("HOT", cv2.COLORMAP_HOT),
@@ -13,6 +26,93 @@ COLORMAP_OPTIONS = [
 ]
 
 
+def _build_lut(colormap: int) -> np.ndarray:
+    """Return the (256, 1, 3) BGR table applyColorMap uses for colormap."""
+    return cv2.applyColorMap(np.arange(256, dtype=np.uint8).reshape(256, 1), colormap)
+
+
+# Resolution at which interactive previews compute the heatmap, relative to the frame.
+PREVIEW_SCALE_OPTIONS = [
+    ("Full", 1.0),
+    ("1/2", 0.5),
+    ("1/4", 0.25),
+]
+
+_COLORMAP_IDS = dict(COLORMAP_OPTIONS)
+COLORMAP_LUTS = {name: _build_lut(constant) for name, constant in COLORMAP_OPTIONS}
+
+# BT.601 luma weights in OpenCV's 15-bit fixed point (B, G, R), as used by
+# cv2.cvtColor(..., COLOR_BGR2GRAY) on 8-bit input.
+_GRAY_SHIFT = 15
+_GRAY_B, _GRAY_G, _GRAY_R = 3735, 19235, 9798
+
+
+if numba is not None:
+    # Compiled eagerly for one signature at import, and loaded from numba's on-disk
+    # cache on later runs, so the first heatmap frame does not stall on the JIT.
+    # Layout "A" accepts cropped views; inputs are typed read-only so cached frames
+    # (handed out with writeable=False) match without a second specialization.
+    _U8_RO = numba.types.Array(numba.types.uint8, 3, "A", readonly=True)
+    _U8_RW = numba.types.Array(numba.types.uint8, 3, "A")
+
+    @numba.njit(
+        numba.types.void(_U8_RO, _U8_RO, _U8_RO, _U8_RW),
+        parallel=True,
+        fastmath=True,
+        cache=True,
+    )
+    def _fused_diff_heatmap(
+        frame: np.ndarray, ref: np.ndarray, lut: np.ndarray, out: np.ndarray
+    ) -> None:
+        """absdiff -> BGR2GRAY -> colormap in a single pass over the pixels."""
+        h, w = frame.shape[0], frame.shape[1]
+        rnd = 1 << (_GRAY_SHIFT - 1)
+        for y in numba.prange(h):
+            for x in range(w):
+                db = abs(np.int32(frame[y, x, 0]) - np.int32(ref[y, x, 0]))
+                dg = abs(np.int32(frame[y, x, 1]) - np.int32(ref[y, x, 1]))
+                dr = abs(np.int32(frame[y, x, 2]) - np.int32(ref[y, x, 2]))
+                g = (_GRAY_B * db + _GRAY_G * dg + _GRAY_R * dr + rnd) >> _GRAY_SHIFT
+                out[y, x, 0] = lut[g, 0, 0]
+                out[y, x, 1] = lut[g, 0, 1]
+                out[y, x, 2] = lut[g, 0, 2]
+
+else:
+    _fused_diff_heatmap = None
+
+
+def _cuda_available() -> bool:
+    """True if OpenCV was built with CUDA and a device is present."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
+_HAS_CUDA = _cuda_available()
+
+# cv::CPU_AVX2; not every cv2 build exports the CPU feature constants.
+_CPU_AVX2 = getattr(cv2, "CPU_AVX2", 11)
+
+
+def _check_simd_build() -> None:
+    """Warn once if the CPU has AVX2 but the OpenCV build cannot dispatch to it."""
+    cv2.setUseOptimized(True)
+    if not cv2.checkHardwareSupport(_CPU_AVX2):
+        return
+    for line in cv2.getBuildInformation().splitlines():
+        line = line.strip()
+        if line.startswith(("Baseline:", "Dispatched code generation:")) and "AVX2" in line:
+            return
+    logger.warning(
+        "OpenCV was built without AVX2 kernels; the difference heatmap will be slower. "
+        "The opencv-python wheels from PyPI include them."
+    )
+
+
+_check_simd_build()
+
+
 class DifferenceHeatmapFilter(BaseFilter):
     """Filter that visualizes per-pixel difference as a heatmap."""
 
@@ -20,20 +120,45 @@ class DifferenceHeatmapFilter(BaseFilter):
     needs_reference = True
 
     def __init__(self) -> None:
-        self._colormap = cv2.COLORMAP_JET
+        self._set_colormap("JET")
+        self.preview_scale = 1.0
+        self._out: np.ndarray | None = None
+        self._diff: np.ndarray | None = None
+        self._gray: np.ndarray | None = None
+        self._preview_frame: np.ndarray | None = None
+        self._preview_ref: np.ndarray | None = None
+        self._preview_out: np.ndarray | None = None
+        # The canvas (GUI thread) and a background export may apply the same
+        # instance concurrently; the scratch buffers above are not shareable.
+        self._lock = threading.Lock()
+        if _HAS_CUDA:
+            self._stream = cv2.cuda_Stream()
+            self._frame_gpu = cv2.cuda_GpuMat()
+            self._ref_gpu = cv2.cuda_GpuMat()
+            self._diff_gpu = cv2.cuda_GpuMat()
+            self._gray_gpu = cv2.cuda_GpuMat()
+
+    def _set_colormap(self, name: str) -> None:
+        self._colormap = _COLORMAP_IDS[name]
+        self._lut = COLORMAP_LUTS[name]
 
     def configure(self, params: dict) -> None:
         """Apply user-supplied parameters."""
         super().configure(params)
-        if "colormap" in params:
-            colormap_name = params["colormap"]
-            for name, constant in COLORMAP_OPTIONS:
-                if name == colormap_name:
-                    self._colormap = constant
-                    break
-
-    def get_config_ui(self) -> QWidget:
-        """Return a widget with a QComboBox for selecting the colormap."""
+        if params.get("colormap") in COLORMAP_LUTS:
+            self._set_colormap(params["colormap"])
+        if "preview_scale" in params:
+            try:
+                scale = float(params["preview_scale"])
+            except (TypeError, ValueError):
+                scale = 0.0
+            if 0.0 < scale <= 1.0:
+                self.preview_scale = scale
+
+    def get_config_ui(self) -> "QWidget":
+        """Return a widget with QComboBoxes for the colormap and preview scale."""
+        from PySide6.QtWidgets import QComboBox, QFormLayout, QWidget
+
         widget = QWidget()
         layout = QFormLayout(widget)
 
@@ -43,24 +168,107 @@ class DifferenceHeatmapFilter(BaseFilter):
         combo.setCurrentText("JET")
 
         def on_colormap_changed(index: int) -> None:
-            self._colormap = COLORMAP_OPTIONS[index][1]
+            self._set_colormap(combo.itemText(index))
 
         combo.currentIndexChanged.connect(on_colormap_changed)
         layout.addRow("Colormap:", combo)
 
+        scale_combo = QComboBox()
+        for name, scale in PREVIEW_SCALE_OPTIONS:
+            scale_combo.addItem(name, scale)
+            if scale == self.preview_scale:
+                scale_combo.setCurrentIndex(scale_combo.count() - 1)
+
+        def on_preview_scale_changed(index: int) -> None:
+            self.preview_scale = scale_combo.itemData(index)
+
+        scale_combo.currentIndexChanged.connect(on_preview_scale_changed)
+        layout.addRow("Preview scale:", scale_combo)
+
         return widget
 
     def apply(
-        self, frame: np.ndarray, ref_frame: np.ndarray | None = None
+        self,
+        frame: np.ndarray,
+        ref_frame: np.ndarray | None = None,
+        out: np.ndarray | None = None,
     ) -> np.ndarray:
         """Compute per-pixel absolute difference and apply colormap heatmap.
 
-        If ref_frame is None, returns frame unchanged.
+        If ref_frame is None, returns frame itself (not a copy). Without out, the
+        result is written to a buffer owned by the filter and reused by the next
+        call; such calls (the interactive canvas) honour preview_scale by computing
+        the heatmap at reduced resolution and upscaling it. Calls with out (export)
+        are always full resolution.
+
+        Raises:
+            ValueError: If frame and ref_frame differ in size, whichever
+                resolution the heatmap would be computed at.
         """
         if ref_frame is None:
-            return frame.copy()
+            return frame
+        if frame.shape[:2] != ref_frame.shape[:2]:
+            raise ValueError(
+                f"Reference frame size {ref_frame.shape[1]}x{ref_frame.shape[0]} "
+                f"does not match frame size {frame.shape[1]}x{frame.shape[0]}"
+            )
+
+        with self._lock:
+            if out is None:
+                if self._out is None or self._out.shape != frame.shape:
+                    self._out = np.empty_like(frame)
+                out = self._out
+                if self.preview_scale < 1.0:
+                    return self._heatmap_preview(frame, ref_frame, out)
+
+            return self._heatmap(frame, ref_frame, out)
+
+    def _heatmap(self, frame: np.ndarray, ref_frame: np.ndarray, out: np.ndarray) -> np.ndarray:
+        if _HAS_CUDA and frame.shape == ref_frame.shape:
+            gray_diff = self._gray_diff_cuda(frame, ref_frame)
+            return cv2.applyColorMap(gray_diff, self._colormap, dst=out)
+
+        if _fused_diff_heatmap is not None and frame.shape == ref_frame.shape:
+            _fused_diff_heatmap(frame, ref_frame, self._lut, out)
+            return out
+
+        self._ensure_scratch(frame.shape)
+        diff = cv2.absdiff(frame, ref_frame, dst=self._diff)
+        gray_diff = cv2.cvtColor(diff, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        return cv2.applyColorMap(gray_diff, self._colormap, dst=out)
+
+    def _heatmap_preview(
+        self, frame: np.ndarray, ref_frame: np.ndarray, out: np.ndarray
+    ) -> np.ndarray:
+        """Compute the heatmap at preview_scale and upscale it into out."""
+        h, w = frame.shape[:2]
+        small_w = max(1, round(w * self.preview_scale))
+        small_h = max(1, round(h * self.preview_scale))
+        small_shape = (small_h, small_w) + frame.shape[2:]
+        if self._preview_frame is None or self._preview_frame.shape != small_shape:
+            self._preview_frame = np.empty(small_shape, dtype=np.uint8)
+            self._preview_ref = np.empty(small_shape, dtype=np.uint8)
+            self._preview_out = np.empty(small_shape, dtype=np.uint8)
+        size = (small_w, small_h)
+        cv2.resize(frame, size, dst=self._preview_frame, interpolation=cv2.INTER_AREA)
+        cv2.resize(ref_frame, size, dst=self._preview_ref, interpolation=cv2.INTER_AREA)
+        heat = self._heatmap(self._preview_frame, self._preview_ref, self._preview_out)
+        return cv2.resize(heat, (w, h), dst=out, interpolation=cv2.INTER_NEAREST)
+
+    def _ensure_scratch(self, shape: tuple[int, ...]) -> None:
+        if self._diff is None or self._diff.shape != shape:
+            self._diff = np.empty(shape, dtype=np.uint8)
+            self._gray = np.empty(shape[:2], dtype=np.uint8)
 
-        diff = cv2.absdiff(frame, ref_frame)
-        gray_diff = cv2.cvtColor(diff, cv2.COLOR_BGR2GRAY)
-        heatmap = cv2.applyColorMap(gray_diff, self._colormap)
-        return heatmap
+    def _gray_diff_cuda(self, frame: np.ndarray, ref_frame: np.ndarray) -> np.ndarray:
+        """Run absdiff and BGR2GRAY on the GPU; return the gray diff on the host."""
+        if self._gray is None or self._gray.shape != frame.shape[:2]:
+            self._gray = np.empty(frame.shape[:2], dtype=np.uint8)
+        stream = self._stream
+        self._frame_gpu.upload(frame, stream)
+        self._ref_gpu.upload(ref_frame, stream)
+        cv2.cuda.absdiff(self._frame_gpu, self._ref_gpu, self._diff_gpu, stream=stream)
+        cv2.cuda.cvtColor(self._diff_gpu, cv2.COLOR_BGR2GRAY, self._gray_gpu, stream=stream)
+        self._gray_gpu.download(stream, self._gray)
+        stream.waitForCompletion()
+        return self._gray
@@ -0,0 +1,72 @@
+"""Zoom and pan arithmetic for the canvas ROI in normalised frame coordinates.
+
+ROIs are (x1, y1, x2, y2) tuples within [0, 1]. Both functions keep the ROI
+inside the frame by shifting it rather than squeezing it.
+"""
+
+try:
+    import numba
+except ImportError:  # optional: the plain Python functions are used
+    numba = None
+
+
+def _shift_into_unit(
+    x1: float, y1: float, x2: float, y2: float
+) -> tuple[float, float, float, float]:
+    """Shift (not squeeze) the ROI back inside [0, 1], then clip what still overhangs."""
+    if x1 < 0.0:
+        x2 -= x1
+        x1 = 0.0
+    if y1 < 0.0:
+        y2 -= y1
+        y1 = 0.0
+    if x2 > 1.0:
+        x1 -= x2 - 1.0
+        x2 = 1.0
+    if y2 > 1.0:
+        y1 -= y2 - 1.0
+        y2 = 1.0
+    return (max(0.0, x1), max(0.0, y1), min(1.0, x2), min(1.0, y2))
+
+
+def compute_zoom_roi(
+    x1: float, y1: float, x2: float, y2: float, factor: float, ax: float, ay: float
+) -> tuple[float, float, float, float]:
+    """Scale the ROI by *factor* around the absolute point (ax, ay).
+
+    The anchor stays at the same relative position inside the ROI. Returns
+    the full frame (0, 0, 1, 1) once the zoomed ROI would cover it.
+    """
+    w = x2 - x1
+    h = y2 - y1
+    new_w = w * factor
+    new_h = h * factor
+    if new_w >= 1.0 and new_h >= 1.0:
+        return (0.0, 0.0, 1.0, 1.0)
+
+    rel_x = (ax - x1) / w if w > 0.0 else 0.5
+    rel_y = (ay - y1) / h if h > 0.0 else 0.5
+    new_x1 = ax - rel_x * new_w
+    new_y1 = ay - rel_y * new_h
+    return _shift_into_unit(new_x1, new_y1, new_x1 + new_w, new_y1 + new_h)
+
+
+def compute_pan_roi(
+    x1: float, y1: float, x2: float, y2: float, dx: float, dy: float
+) -> tuple[float, float, float, float]:
+    """Translate the ROI by (dx, dy) in normalised units."""
+    return _shift_into_unit(x1 + dx, y1 + dy, x2 + dx, y2 + dy)
+
+
+if numba is not None:
+    # Compiled eagerly (and cached on disk) for float64 arguments so the first
+    # wheel notch does not stall on the JIT.
+    _f8 = numba.types.float64
+    _roi_t = numba.types.UniTuple(_f8, 4)
+    _shift_into_unit = numba.njit(_roi_t(_f8, _f8, _f8, _f8), cache=True)(_shift_into_unit)
+    compute_zoom_roi = numba.njit(
+        _roi_t(_f8, _f8, _f8, _f8, _f8, _f8, _f8), cache=True
+    )(compute_zoom_roi)
+    compute_pan_roi = numba.njit(_roi_t(_f8, _f8, _f8, _f8, _f8, _f8), cache=True)(
+        compute_pan_roi
+    )
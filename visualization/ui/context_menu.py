@@ -32,12 +32,11 @@ class VideoContextMenu(QMenu):
         action_filter = self.addAction("Set Filter")
         action_filter.triggered.connect(self._on_set_filter)
 
-        action_clear_filter = self.addAction("Clear Filter")
-        action_clear_filter.triggered.connect(self._on_clear_filter)
-        action_clear_filter.setEnabled(video_entry.filter is not None)
+        self._action_clear_filter = self.addAction("Clear Filter")
+        self._action_clear_filter.triggered.connect(self._on_clear_filter)
 
-        action_clear_filter_all = self.addAction("Clear Filter (All)")
-        action_clear_filter_all.triggered.connect(self._on_clear_filter_all)
+        self._action_clear_filter_all = self.addAction("Clear Filter (All)")
+        self._action_clear_filter_all.triggered.connect(self._on_clear_filter_all)
 
         self.addSeparator()
 
@@ -50,6 +49,18 @@ class VideoContextMenu(QMenu):
         action_audio.triggered.connect(self._on_set_audio)
         action_audio.setEnabled(video_entry.info.has_audio)
 
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Update the entries that depend on the current filter state.
+
+        Call before showing a menu that is reused across openings.
+        """
+        self._action_clear_filter.setEnabled(self._video_entry.filter is not None)
+        self._action_clear_filter_all.setEnabled(
+            any(v.filter is not None for v in self._video_manager.get_all_videos())
+        )
+
     def _on_set_caption(self) -> None:
         """Open input dialog and update caption on OK."""
         text, ok = QInputDialog.getText(
@@ -71,7 +82,10 @@ class VideoContextMenu(QMenu):
         self.filter_cleared.emit(self._video_entry.video_id)
 
     def _on_clear_filter_all(self) -> None:
-        for v in self._video_manager.get_all_videos():
+        videos = self._video_manager.get_all_videos()
+        if not any(v.filter is not None for v in videos):
+            return
+        for v in videos:
             v.filter = None
         self.filter_cleared_all.emit()
 
@@ -1,5 +1,6 @@
 """Dialog for configuring and triggering video export."""
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -27,8 +28,23 @@ class ExportDialog(QDialog):
     ) -> None:
         super().__init__(parent)
         self._video_manager = video_manager
+        # The loaded videos cannot change while the dialog is open; reset()
+        # refreshes this before each reuse.
+        self._max_w, self._max_h = video_manager.max_resolution
         self._setup_ui()
 
+    def reset(self) -> None:
+        """Return the dialog to its initial state for the current set of videos."""
+        self._max_w, self._max_h = self._video_manager.max_resolution
+        self._path_edit.clear()
+        self._width_spin.setValue(0)
+        self._height_spin.setValue(0)
+        self._info_timer.stop()
+        self._update_info()
+        self._output_path = ""
+        self._export_width = None
+        self._export_height = None
+
     def _setup_ui(self) -> None:
         layout = QVBoxLayout(self)
 
@@ -42,19 +58,26 @@ class ExportDialog(QDialog):
         path_layout.addWidget(browse_btn)
         layout.addLayout(path_layout)
 
+        # Coalesce bursts of spin box steps (held arrow keys, wheel) into one
+        # label update per event-loop pass.
+        self._info_timer = QTimer(self)
+        self._info_timer.setSingleShot(True)
+        self._info_timer.setInterval(0)
+        self._info_timer.timeout.connect(self._update_info)
+
         form = QFormLayout()
         self._width_spin = QSpinBox()
         self._width_spin.setRange(0, 7680)
         self._width_spin.setValue(0)
         self._width_spin.setSpecialValueText("Auto")
-        self._width_spin.valueChanged.connect(self._update_info)
+        self._width_spin.valueChanged.connect(self._schedule_update_info)
         form.addRow("Export width:", self._width_spin)
 
         self._height_spin = QSpinBox()
         self._height_spin.setRange(0, 4320)
         self._height_spin.setValue(0)
         self._height_spin.setSpecialValueText("Auto")
-        self._height_spin.valueChanged.connect(self._update_info)
+        self._height_spin.valueChanged.connect(self._schedule_update_info)
         form.addRow("Export height:", self._height_spin)
         layout.addLayout(form)
 
@@ -80,16 +103,19 @@ class ExportDialog(QDialog):
         if path:
             self._path_edit.setText(path)
 
+    def _schedule_update_info(self) -> None:
+        self._info_timer.start()
+
     def _update_info(self) -> None:
         w = self._width_spin.value() if self._width_spin else 0
         h = self._height_spin.value() if self._height_spin else 0
-        max_w, max_h = self._video_manager.max_resolution
-        out_w = w if w > 0 else max_w
-        out_h = h if h > 0 else max_h
-        self._info_label.setText(
-            f"Output resolution: {out_w}×{out_h}"
-            + (" (from videos)" if w == 0 or h == 0 else "")
-        )
+        out_w = w if w > 0 else self._max_w
+        out_h = h if h > 0 else self._max_h
+        suffix = " (from videos)" if w == 0 or h == 0 else ""
+        text = f"Output resolution: {out_w}×{out_h}{suffix}"
+        # setText() relayouts the dialog even when the text is unchanged.
+        if text != self._info_label.text():
+            self._info_label.setText(text)
 
     def accept(self) -> None:
         self._output_path = self._path_edit.text().strip()
@@ -0,0 +1,64 @@
+"""Background export job so the GUI stays responsive while exporting."""
+
+import threading
+import time
+from typing import Any
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from visualization.core.exporter import Exporter
+
+
+class ExportJobSignals(QObject):
+    """Signals of an ExportJob; created on the GUI thread, so they are queued there."""
+
+    progress = Signal(int)  # frames written so far
+    finished = Signal()
+    cancelled = Signal()
+    failed = Signal(str)
+
+
+# Minimum seconds between progress signals; repainting the dialog for every
+# frame of a long export costs more than it shows.
+_PROGRESS_INTERVAL_SEC = 1 / 30
+
+
+class ExportJob(QRunnable):
+    """Runs Exporter.export on a QThreadPool worker thread.
+
+    Setting cancel_event stops the export before the next frame is written.
+    """
+
+    def __init__(
+        self,
+        exporter: Exporter,
+        export_kwargs: dict[str, Any],
+        cancel_event: threading.Event,
+    ) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = ExportJobSignals()
+        self._exporter = exporter
+        self._export_kwargs = export_kwargs
+        self._cancel_event = cancel_event
+
+    def run(self) -> None:
+        last_emit = 0.0
+
+        def on_progress(frame_idx: int, total_frames: int) -> None:
+            nonlocal last_emit
+            if self._cancel_event.is_set():
+                raise InterruptedError("Export cancelled by user.")
+            now = time.monotonic()
+            if now - last_emit >= _PROGRESS_INTERVAL_SEC or frame_idx + 1 == total_frames:
+                last_emit = now
+                self.signals.progress.emit(frame_idx + 1)
+
+        try:
+            self._exporter.export(progress_callback=on_progress, **self._export_kwargs)
+        except InterruptedError:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit()
@@ -30,9 +30,14 @@ class FilterDialog(QDialog):
         self._video_entry = video_entry
         self._video_manager = video_manager
         self._filter_instances: dict[str, BaseFilter] = {}
+        self._filter_pages: dict[str, int] = {}
+        self._filter_names = FilterRegistry.get_filter_names()
+        # Combo index of each filter name; index 0 is "None".
+        self._filter_name_to_idx = {name: i + 1 for i, name in enumerate(self._filter_names)}
         self._ref_combo: QComboBox | None = None
         self._ref_widget: QWidget | None = None
         self._apply_all_cb: QCheckBox | None = None
+        self._target_ids: list[int] = []
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -42,30 +47,27 @@ class FilterDialog(QDialog):
         top_layout = QHBoxLayout()
         self._filter_combo = QComboBox()
         self._filter_combo.addItem("None")
-        for name in FilterRegistry.get_filter_names():
+        for name in self._filter_names:
             self._filter_combo.addItem(name)
         self._filter_combo.currentTextChanged.connect(self._on_filter_changed)
         top_layout.addWidget(self._filter_combo)
 
+        # Filters and their config pages are created the first time they are
+        # selected; page 0 is "None".
         self._stacked = QStackedWidget()
         self._stacked.addWidget(QWidget())
-        for name in FilterRegistry.get_filter_names():
-            f = FilterRegistry.create_filter(name)
-            self._filter_instances[name] = f
-            self._stacked.addWidget(f.get_config_ui())
         top_layout.addWidget(self._stacked)
         layout.addLayout(top_layout)
 
         # Reference video selector — default to video 0
         self._ref_combo = QComboBox()
-        default_ref_idx = 0
-        for i, v in enumerate(self._video_manager.get_all_videos()):
+        ref_id_to_idx: dict[int, int] = {}
+        for v in self._video_manager.get_all_videos():
             if v.video_id != self._video_entry.video_id:
+                ref_id_to_idx[v.video_id] = self._ref_combo.count()
                 self._ref_combo.addItem(f"{v.video_id}: {v.label}", v.video_id)
-                if v.video_id == 0:
-                    default_ref_idx = self._ref_combo.count() - 1
         if self._ref_combo.count() > 0:
-            self._ref_combo.setCurrentIndex(default_ref_idx)
+            self._ref_combo.setCurrentIndex(ref_id_to_idx.get(0, 0))
 
         self._ref_widget = QWidget()
         ref_layout = QFormLayout(self._ref_widget)
@@ -80,19 +82,13 @@ class FilterDialog(QDialog):
         self._apply_all_cb.setVisible(False)
 
         # Restore state from the video's current filter
-        if self._video_entry.filter is not None:
-            for i, name in enumerate(FilterRegistry.get_filter_names()):
-                if name == self._video_entry.filter.name:
-                    self._filter_combo.setCurrentIndex(i + 1)
-                    if self._video_entry.filter.needs_reference and hasattr(
-                        self._video_entry.filter, "ref_video_id"
-                    ):
-                        ref_id = self._video_entry.filter.ref_video_id
-                        for j in range(self._ref_combo.count()):
-                            if self._ref_combo.itemData(j) == ref_id:
-                                self._ref_combo.setCurrentIndex(j)
-                                break
-                    break
+        current = self._video_entry.filter
+        if current is not None and current.name in self._filter_name_to_idx:
+            self._filter_combo.setCurrentIndex(self._filter_name_to_idx[current.name])
+            if current.needs_reference and hasattr(current, "ref_video_id"):
+                ref_idx = ref_id_to_idx.get(current.ref_video_id)
+                if ref_idx is not None:
+                    self._ref_combo.setCurrentIndex(ref_idx)
         self._on_filter_changed(self._filter_combo.currentText())
 
         buttons = QDialogButtonBox(
@@ -103,21 +99,33 @@ class FilterDialog(QDialog):
         layout.addWidget(buttons)
 
     def _on_filter_changed(self, name: str) -> None:
-        if name == "None" or name not in self._filter_instances:
+        if name not in self._filter_name_to_idx:
             self._stacked.setCurrentIndex(0)
             if self._ref_widget:
                 self._ref_widget.setVisible(False)
             if self._apply_all_cb:
                 self._apply_all_cb.setVisible(False)
             return
-        idx = FilterRegistry.get_filter_names().index(name) + 1
-        self._stacked.setCurrentIndex(idx)
-        needs_ref = self._filter_instances[name].needs_reference
+        f = self._get_filter(name)
+        page = self._filter_pages.get(name)
+        if page is None:
+            page = self._stacked.addWidget(f.get_config_ui())
+            self._filter_pages[name] = page
+        self._stacked.setCurrentIndex(page)
+        needs_ref = f.needs_reference
         if self._ref_widget:
             self._ref_widget.setVisible(needs_ref)
         if self._apply_all_cb:
             self._apply_all_cb.setVisible(needs_ref)
 
+    def _get_filter(self, name: str) -> BaseFilter:
+        """Return this dialog's instance of the named filter, creating it on first use."""
+        f = self._filter_instances.get(name)
+        if f is None:
+            f = FilterRegistry.create_filter(name)
+            self._filter_instances[name] = f
+        return f
+
     @property
     def apply_to_all(self) -> bool:
         """Whether the user checked 'apply to all except reference'."""
@@ -137,17 +145,34 @@ class FilterDialog(QDialog):
             return None
         return self._ref_combo.currentData()
 
+    @property
+    def target_video_ids(self) -> list[int]:
+        """Other videos to receive the filter when apply_to_all is checked.
+
+        Excludes this dialog's video, and the reference video when the filter
+        needs one. Valid after accept().
+        """
+        return self._target_ids
+
     def accept(self) -> None:
         """Apply selected filter to video_entry."""
         name = self._filter_combo.currentText()
+        self._target_ids = []
         if name == "None":
             self._video_entry.filter = None
         else:
-            f = self._filter_instances.get(name)
-            if f is None:
-                f = FilterRegistry.create_filter(name)
-                self._filter_instances[name] = f
+            f = self._get_filter(name)
             if f.needs_reference and self._ref_combo:
                 f.ref_video_id = self._ref_combo.currentData()
             self._video_entry.filter = f
+            if self.apply_to_all:
+                # Only a filter that diffs against the reference leaves it out.
+                skip = {self._video_entry.video_id}
+                if f.needs_reference:
+                    skip.add(self.selected_ref_id)
+                self._target_ids = [
+                    v.video_id
+                    for v in self._video_manager.get_all_videos()
+                    if v.video_id not in skip
+                ]
         super().accept()
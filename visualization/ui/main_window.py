@@ -2,10 +2,12 @@
 
 import logging
 import math
+import threading
 import time
+from functools import partial
 from pathlib import Path
 
-from PySide6.QtCore import QElapsedTimer, QPoint, QTimer, Qt
+from PySide6.QtCore import QElapsedTimer, QPoint, QSignalBlocker, QThreadPool, QTimer, Qt
 from PySide6.QtGui import QAction, QKeyEvent, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QComboBox,
@@ -29,8 +31,10 @@ from PySide6.QtWidgets import (
 from visualization.core.audio_player import AudioPlayer
 from visualization.core.exporter import Exporter
 from visualization.core.video_manager import FrameCache, VideoManager
+from visualization.filters import FilterRegistry
 from visualization.ui.context_menu import VideoContextMenu
 from visualization.ui.export_dialog import ExportDialog
+from visualization.ui.export_job import ExportJob
 from visualization.ui.filter_dialog import FilterDialog
 from visualization.ui.video_canvas import VideoCanvas
 
@@ -38,6 +42,13 @@ logger = logging.getLogger(__name__)
 
 _VIDEO_EXTENSIONS = "Video Files (*.mp4 *.avi *.mkv *.mov *.webm);;All Files (*)"
 
+# Frames decoded ahead of the playhead during playback, and how far the
+# playhead moves before the window is slid forward.
+_PREFETCH_WINDOW = 64
+_PREFETCH_STEP = 16
+# Frames decoded in the background after a scrub or step lands on a frame.
+_SCRUB_PREFETCH = 8
+
 
 class MainWindow(QMainWindow):
     """Top-level window: menu bar, video canvas, transport controls, status bar."""
@@ -65,11 +76,36 @@ class MainWindow(QMainWindow):
         self._playback_speed = 1.0
         self._playback_start_time: float = 0.0
         self._playback_start_frame: int = 0
+        self._prefetch_from: int = 0
+        self._current_frame = 0  # mirrors the slider value
+        # Session constants for the playback and status hot paths, refreshed in
+        # _after_videos_changed().
+        self._fps = 25.0
+        self._last_frame = 0
+        self._status_total = 0
+        self._status_ms_per_frame = 1000.0 / 25.0
+        self._last_status_frame = -1
+        self._export_job: ExportJob | None = None
+        self._export_cancel: threading.Event | None = None
+        self._export_progress: QProgressDialog | None = None
+        self._export_path = ""
+        self._export_dialog: ExportDialog | None = None
+        # One context menu per video, built on first right-click and reused.
+        self._context_menus: dict[int, VideoContextMenu] = {}
 
         self._playback_timer = QTimer(self)
         self._playback_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._playback_timer.setSingleShot(True)
         self._playback_timer.timeout.connect(self._on_playback_tick)
 
+        # Slider drags emit a value per pixel; decode and audio run once the
+        # slider has been still for a moment.
+        self._scrub_timer = QTimer(self)
+        self._scrub_timer.setSingleShot(True)
+        self._scrub_timer.setInterval(20)
+        self._scrub_timer.timeout.connect(self._apply_scrub)
+        self._pending_scrub_frame = 0
+
         self._setup_menu()
         self._setup_central()
         self._setup_statusbar()
@@ -84,6 +120,7 @@ class MainWindow(QMainWindow):
         load_action = QAction("Load Videos", self)
         load_action.triggered.connect(self._on_load_videos)
         file_menu.addAction(load_action)
+        self._load_action = load_action
 
         view_menu = menu_bar.addMenu("View")
         self._side_by_side_action = QAction("Side-by-Side", self)
@@ -105,12 +142,13 @@ class MainWindow(QMainWindow):
         clear_action = QAction("Clear Videos", self)
         clear_action.triggered.connect(self._on_clear_videos)
         view_menu.addAction(clear_action)
+        self._clear_action = clear_action
 
         view_menu.addSeparator()
         rows_menu = view_menu.addMenu("Set Rows")
         for n in (1, 2, 3, 4):
             action = QAction(f"{n} row{'s' if n > 1 else ''}", self)
-            action.triggered.connect(lambda checked=False, r=n: self._set_rows(r))
+            action.triggered.connect(partial(self._on_rows_action, n))
             rows_menu.addAction(action)
 
         export_action = QAction("Export", self)
@@ -176,15 +214,23 @@ class MainWindow(QMainWindow):
 
     def load_videos(self, paths: list[str | Path]) -> None:
         """Load one or more video files. Called from menu, drag-drop, or CLI."""
-        for p in paths:
-            try:
-                self._video_manager.load_video(p)
-            except ValueError as e:
-                QMessageBox.warning(self, "Framerate mismatch", str(e))
-            except (FileNotFoundError, RuntimeError) as e:
-                QMessageBox.warning(self, "Cannot open video", str(e))
+        if self._export_job is not None:
+            return
+        # Hold canvas repaints until the new layout, slider range and frame
+        # are all in place, then paint once; warnings are shown afterwards so
+        # their event loops do not paint a half-updated canvas.
+        self._canvas.setUpdatesEnabled(False)
+        try:
+            results = self._video_manager.load_videos(paths)
+            self._after_videos_changed()
+        finally:
+            self._canvas.setUpdatesEnabled(True)
 
-        self._after_videos_changed()
+        for result in results:
+            if isinstance(result, ValueError):
+                QMessageBox.warning(self, "Framerate mismatch", str(result))
+            elif isinstance(result, (FileNotFoundError, RuntimeError)):
+                QMessageBox.warning(self, "Cannot open video", str(result))
 
     def _on_load_videos(self) -> None:
         paths, _ = QFileDialog.getOpenFileNames(
@@ -194,7 +240,12 @@ class MainWindow(QMainWindow):
             self.load_videos(paths)
 
     def _on_clear_videos(self) -> None:
+        if self._export_job is not None:
+            return
         self._stop_playback()
+        for menu in self._context_menus.values():
+            menu.deleteLater()
+        self._context_menus.clear()
         self._video_manager.clear()
         self._frame_cache.clear()
         self._audio_player.clear()
@@ -202,7 +253,12 @@ class MainWindow(QMainWindow):
 
     def _after_videos_changed(self) -> None:
         max_frames = self._video_manager.max_frame_count
-        self._slider.setMaximum(max(0, max_frames - 1))
+        self._fps = self._video_manager.session_fps or 25.0
+        self._last_frame = max(0, max_frames - 1)
+        self._status_total = max_frames
+        self._status_ms_per_frame = 1000.0 / self._fps
+        self._last_status_frame = -1
+        self._slider.setMaximum(self._last_frame)
         self._slider.setValue(0)
         self._canvas.set_frame(0)
         self._update_status(0)
@@ -219,21 +275,36 @@ class MainWindow(QMainWindow):
         """Set audio source to video 0 if it has audio."""
         v0 = self._video_manager.get_video(0)
         if v0 and v0.info.has_audio:
-            self._audio_player.set_source(v0.info.path, v0.info.fps)
+            self._audio_player.set_source(
+                v0.info.path, v0.info.fps, v0.info.duration_sec
+            )
 
     def _update_controls_state(self) -> None:
         has_videos = self._video_manager.video_count > 0
+        # A running export reads the loaded videos, their filters and the frame
+        # cache from its worker thread, so the session stays fixed until it
+        # has actually stopped (not just until Cancel is pressed).
+        exporting = self._export_job is not None
         self._slider.setEnabled(has_videos)
         self._play_btn.setEnabled(has_videos)
-        self._export_action.setEnabled(has_videos)
+        self._export_action.setEnabled(has_videos and not exporting)
+        self._load_action.setEnabled(not exporting)
+        self._clear_action.setEnabled(not exporting)
 
     # ── Scrubbing & playback ──────────────────────────────────────────
 
     def _on_slider_changed(self, value: int) -> None:
+        self._current_frame = value
         if not self._playing:
-            self._canvas.set_frame(value)
             self._update_status(value)
-            self._audio_player.play_snippet(value)
+            self._pending_scrub_frame = value
+            self._scrub_timer.start()
+
+    def _apply_scrub(self) -> None:
+        if self._playing:
+            return
+        self._canvas.set_frame(self._pending_scrub_frame, prefetch=_SCRUB_PREFETCH)
+        self._audio_player.play_snippet(self._pending_scrub_frame)
 
     def _toggle_playback(self) -> None:
         if self._playing:
@@ -248,55 +319,94 @@ class MainWindow(QMainWindow):
         self._playing = True
         self._play_btn.setText("⏸")
         self._playback_start_time = time.monotonic()
-        self._playback_start_frame = self._slider.value()
-        self._playback_timer.start(8)
-        self._audio_player.play_from(self._slider.value())
+        self._playback_start_frame = self._current_frame
+        self._prefetch_from = self._playback_start_frame
+        self._frame_cache.prefetch(
+            self._video_manager.get_all_videos(), self._prefetch_from, _PREFETCH_WINDOW
+        )
+        self._playback_timer.start(0)
+        self._audio_player.play_from(self._current_frame)
 
     def _stop_playback(self) -> None:
         self._playing = False
         self._play_btn.setText("▶")
         self._playback_timer.stop()
+        self._frame_cache.cancel_prefetch()
         self._audio_player.stop()
 
-    def _on_playback_tick(self) -> None:
-        fps = self._video_manager.session_fps or 25.0
+    def _playback_position(self, fps: float) -> float:
+        """Media time of the playhead in seconds.
+
+        Audio is the master clock while it plays at normal speed; otherwise
+        the wall clock since playback (re)started is scaled by the speed.
+        """
+        if self._playback_speed == 1.0:
+            audio_pos = self._audio_player.position()
+            if audio_pos is not None:
+                return audio_pos
         elapsed = time.monotonic() - self._playback_start_time
-        expected_frame = self._playback_start_frame + int(
-            elapsed * fps * self._playback_speed
-        )
-        expected_frame = min(expected_frame, self._slider.maximum())
-        if expected_frame > self._slider.maximum() - 1:
-            self._slider.blockSignals(True)
-            self._slider.setValue(self._slider.maximum())
-            self._slider.blockSignals(False)
-            self._canvas.set_frame(self._slider.maximum())
-            self._update_status(self._slider.maximum())
+        return self._playback_start_frame / fps + elapsed * self._playback_speed
+
+    def _on_playback_tick(self) -> None:
+        fps = self._fps
+        last_frame = self._last_frame
+        position = self._playback_position(fps)
+        # The epsilon keeps exact frame boundaries from rounding down.
+        expected_frame = max(self._playback_start_frame, int(position * fps + 1e-6))
+        expected_frame = min(expected_frame, last_frame)
+        if expected_frame > last_frame - 1:
+            self._apply_frame(last_frame)
             self._stop_playback()
             return
-        if expected_frame != self._slider.value():
-            self._slider.blockSignals(True)
-            self._slider.setValue(expected_frame)
-            self._slider.blockSignals(False)
-            self._canvas.set_frame(expected_frame)
-            self._update_status(expected_frame)
+        if expected_frame != self._current_frame:
+            self._apply_frame(expected_frame)
+        if expected_frame >= self._prefetch_from + _PREFETCH_STEP:
+            self._prefetch_from = expected_frame
+            self._frame_cache.prefetch(
+                self._video_manager.get_all_videos(), expected_frame, _PREFETCH_WINDOW
+            )
+
+        # Sleep until the next frame is due instead of polling; if painting
+        # fell behind, intermediate frames are skipped on the next tick.
+        delay_sec = ((expected_frame + 1) / fps - position) / self._playback_speed
+        self._playback_timer.start(max(1, math.ceil(delay_sec * 1000)))
+
+    def _apply_frame(self, frame_idx: int) -> None:
+        """Show frame_idx during playback.
+
+        The slider is moved with its signals blocked so this does not re-enter
+        the scrubbing path; the canvas and labels only schedule repaints, which
+        Qt merges into one paint pass.
+        """
+        with QSignalBlocker(self._slider):
+            self._slider.setValue(frame_idx)
+        self._current_frame = frame_idx
+        self._canvas.set_frame(frame_idx)
+        self._update_status(frame_idx)
 
     def _on_speed_changed(self, value: float) -> None:
         if self._playing:
-            current = self._slider.value()
+            current = self._current_frame
             self._playback_start_time = time.monotonic()
             self._playback_start_frame = current
             self._audio_player.stop()
             self._audio_player.play_from(current)
         self._playback_speed = value
+        if self._playing:
+            self._playback_timer.start(0)
 
     # ── Keyboard navigation ───────────────────────────────────────────
 
     def keyPressEvent(self, event: QKeyEvent) -> None:
+        # A held key jumps 0.1 s per auto-repeat instead of single-stepping, so
+        # OS key repeat does not queue a decode for every frame; the slider's
+        # scrub timer still coalesces the redraws and audio snippets.
+        step = max(1, int(self._fps / 10)) if event.isAutoRepeat() else 1
         if event.key() == Qt.Key.Key_Left:
-            self._slider.setValue(max(0, self._slider.value() - 1))
+            self._slider.setValue(max(0, self._slider.value() - step))
         elif event.key() == Qt.Key.Key_Right:
             self._slider.setValue(
-                min(self._slider.maximum(), self._slider.value() + 1)
+                min(self._slider.maximum(), self._slider.value() + step)
             )
         else:
             super().keyPressEvent(event)
@@ -304,7 +414,7 @@ class MainWindow(QMainWindow):
     # ── Drag and drop ─────────────────────────────────────────────────
 
     def dragEnterEvent(self, event) -> None:
-        if event.mimeData().hasUrls():
+        if event.mimeData().hasUrls() and self._export_job is None:
             event.acceptProposedAction()
 
     def dropEvent(self, event) -> None:
@@ -316,15 +426,20 @@ class MainWindow(QMainWindow):
 
     def _on_context_menu(self, video_id: int, pos: QPoint) -> None:
         entry = self._video_manager.get_video(video_id)
-        if entry is None:
+        if entry is None or self._export_job is not None:
             return
-        menu = VideoContextMenu(entry, self._video_manager, self)
-        menu.caption_changed.connect(lambda vid, txt: self._canvas.update())
-        menu.filter_requested.connect(self._on_filter_requested)
-        menu.filter_cleared.connect(self._on_filter_cleared)
-        menu.filter_cleared_all.connect(self._on_filter_cleared_all)
-        menu.zoom_reset_requested.connect(self._canvas.reset_roi)
-        menu.audio_source_changed.connect(self._on_audio_source_changed)
+        menu = self._context_menus.get(video_id)
+        if menu is None:
+            menu = VideoContextMenu(entry, self._video_manager, self)
+            menu.caption_changed.connect(lambda vid, txt: self._canvas.update())
+            menu.filter_requested.connect(self._on_filter_requested)
+            menu.filter_cleared.connect(self._on_filter_cleared)
+            menu.filter_cleared_all.connect(self._on_filter_cleared_all)
+            menu.zoom_reset_requested.connect(self._canvas.reset_roi)
+            menu.audio_source_changed.connect(self._on_audio_source_changed)
+            self._context_menus[video_id] = menu
+        else:
+            menu.refresh()
         menu.exec(pos)
 
     def _on_filter_requested(self, video_id: int) -> None:
@@ -332,45 +447,54 @@ class MainWindow(QMainWindow):
         if entry is None:
             return
         dlg = FilterDialog(entry, self._video_manager, self)
+        # The frame cache holds decoded frames before filtering, so filter changes
+        # only need a repaint, not a re-decode.
         if dlg.exec():
-            self._frame_cache.clear(video_id)
             if dlg.apply_to_all and dlg.selected_filter_name != "None":
-                from visualization.filters import FilterRegistry
-
                 ref_id = dlg.selected_ref_id
-                for v in self._video_manager.get_all_videos():
-                    if v.video_id == entry.video_id:
-                        continue
-                    if ref_id is not None and v.video_id == ref_id:
-                        v.filter = None
+                ref_entry = self._video_manager.get_video(ref_id) if ref_id is not None else None
+                if ref_entry is not None and ref_id not in dlg.target_video_ids:
+                    ref_entry.filter = None
+                for target_id in dlg.target_video_ids:
+                    v = self._video_manager.get_video(target_id)
+                    if v is None:
                         continue
                     flt = FilterRegistry.create_filter(dlg.selected_filter_name)
                     if flt.needs_reference and ref_id is not None:
                         flt.ref_video_id = ref_id
                     v.filter = flt
-                    self._frame_cache.clear(v.video_id)
-            self._canvas.update()
+            self._request_canvas_repaint()
 
     def _on_filter_cleared(self, video_id: int) -> None:
-        self._frame_cache.clear(video_id)
-        self._canvas.update()
+        self._request_canvas_repaint()
 
     def _on_filter_cleared_all(self) -> None:
-        self._frame_cache.clear()
-        self._canvas.update()
+        self._request_canvas_repaint()
+
+    def _request_canvas_repaint(self) -> None:
+        """Schedule a canvas repaint if there is anything on screen to redraw."""
+        if self._video_manager.video_count and self._canvas.isVisible():
+            self._canvas.update()
 
     def _on_audio_source_changed(self, video_id: int) -> None:
         entry = self._video_manager.get_video(video_id)
         if entry is None:
             return
-        self._audio_player.set_source(entry.info.path, entry.info.fps)
+        self._audio_player.set_source(
+            entry.info.path, entry.info.fps, entry.info.duration_sec
+        )
 
     # ── Export ─────────────────────────────────────────────────────────
 
     def _on_export(self) -> None:
-        if self._video_manager.video_count == 0:
+        if self._video_manager.video_count == 0 or self._export_job is not None:
             return
-        dlg = ExportDialog(self._video_manager, self)
+        # Built on first use and reset for each export rather than rebuilt.
+        if self._export_dialog is None:
+            self._export_dialog = ExportDialog(self._video_manager, self)
+        else:
+            self._export_dialog.reset()
+        dlg = self._export_dialog
         if not dlg.exec():
             return
         if not dlg.output_path:
@@ -384,39 +508,59 @@ class MainWindow(QMainWindow):
         progress = QProgressDialog("Exporting video...", "Cancel", 0, total, self)
         progress.setWindowModality(Qt.WindowModality.WindowModal)
         progress.setMinimumDuration(0)
-        cancelled = False
 
-        def on_progress(frame_idx: int, total_frames: int) -> None:
-            nonlocal cancelled
-            progress.setValue(frame_idx + 1)
-            if progress.wasCanceled():
-                cancelled = True
-                raise InterruptedError("Export cancelled by user.")
+        # The export runs on a pool thread so the GUI keeps painting; its
+        # signals are queued back here and Cancel sets the event it polls.
+        cancel_event = threading.Event()
+        progress.canceled.connect(cancel_event.set)
+        job = ExportJob(
+            exporter,
+            {
+                "output_path": dlg.output_path,
+                "export_width": dlg.export_width,
+                "export_height": dlg.export_height,
+                "audio_source_path": self._audio_player.source_path,
+                "rows": self._rows,
+                "roi": self._canvas.roi,
+            },
+            cancel_event,
+        )
+        job.signals.progress.connect(progress.setValue)
+        job.signals.finished.connect(self._on_export_finished)
+        job.signals.cancelled.connect(self._on_export_cancelled)
+        job.signals.failed.connect(self._on_export_failed)
+
+        self._export_job = job
+        self._export_cancel = cancel_event
+        self._export_progress = progress
+        self._export_path = dlg.output_path
+        self._update_controls_state()
+        QThreadPool.globalInstance().start(job)
+
+    def _end_export(self) -> None:
+        if self._export_progress is not None:
+            self._export_progress.close()
+        self._export_job = None
+        self._export_cancel = None
+        self._export_progress = None
+        self._update_controls_state()
 
-        audio_path = self._audio_player._source_path
-        try:
-            exporter.export(
-                output_path=dlg.output_path,
-                export_width=dlg.export_width,
-                export_height=dlg.export_height,
-                audio_source_path=audio_path,
-                rows=self._rows,
-                roi=self._canvas.roi,
-                progress_callback=on_progress,
-            )
-            progress.close()
-            if not cancelled:
-                QMessageBox.information(
-                    self, "Export", f"Export complete:\n{dlg.output_path}"
-                )
-        except InterruptedError:
-            progress.close()
-        except Exception as e:
-            progress.close()
-            QMessageBox.critical(self, "Export failed", str(e))
+    def _on_export_finished(self) -> None:
+        self._end_export()
+        QMessageBox.information(self, "Export", f"Export complete:\n{self._export_path}")
+
+    def _on_export_cancelled(self) -> None:
+        self._end_export()
+
+    def _on_export_failed(self, message: str) -> None:
+        self._end_export()
+        QMessageBox.critical(self, "Export failed", message)
 
     # ── Rows ──────────────────────────────────────────────────────────
 
+    def _on_rows_action(self, rows: int, _checked: bool = False) -> None:
+        self._set_rows(rows)
+
     def _set_rows(self, rows: int) -> None:
         self._rows = rows
         self._canvas.set_rows(rows)
@@ -499,17 +643,20 @@ class MainWindow(QMainWindow):
     # ── Status bar update ─────────────────────────────────────────────
 
     def _update_status(self, frame_idx: int) -> None:
-        total = self._video_manager.max_frame_count
-        fps = self._video_manager.session_fps or 25.0
-        t_sec = frame_idx / fps
-        minutes = int(t_sec) // 60
-        seconds = t_sec - minutes * 60
-        self._frame_label.setText(f"Frame: {frame_idx} / {total}")
-        self._time_label.setText(f"Time: {minutes:02d}:{seconds:06.3f}")
+        if frame_idx == self._last_status_frame:
+            return
+        self._last_status_frame = frame_idx
+        minutes, ms = divmod(round(frame_idx * self._status_ms_per_frame), 60_000)
+        seconds, ms = divmod(ms, 1000)
+        self._frame_label.setText(f"Frame: {frame_idx} / {self._status_total}")
+        self._time_label.setText(f"Time: {minutes:02d}:{seconds:02d}.{ms:03d}")
 
     # ── Cleanup ───────────────────────────────────────────────────────
 
     def closeEvent(self, event) -> None:
+        if self._export_cancel is not None:
+            self._export_cancel.set()
+            QThreadPool.globalInstance().waitForDone()
         self._stop_playback()
         self._audio_player.cleanup()
         self._video_manager.clear()
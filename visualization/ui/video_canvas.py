@@ -1,19 +1,36 @@
 """Video canvas widget for rendering video panels in a grid layout."""
 
 import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import cv2
 import numpy as np
-from PySide6.QtCore import QPoint, QRect, QRectF, Qt, Signal
-from PySide6.QtGui import QColor, QFont, QFontMetrics, QImage, QMouseEvent, QPainter, QPen, QWheelEvent
+from PySide6.QtCore import QPoint, QRect, QRectF, Qt, QTimer, Signal
+from PySide6.QtGui import (
+    QColor,
+    QFont,
+    QFontMetrics,
+    QImage,
+    QMouseEvent,
+    QPainter,
+    QPen,
+    QPixmap,
+    QWheelEvent,
+)
 from PySide6.QtWidgets import QWidget
 
 from visualization.core.video_manager import FrameCache, VideoManager
+from visualization.ui._roi_math import compute_pan_roi, compute_zoom_roi
 
 if TYPE_CHECKING:
     from visualization.core.video_manager import VideoEntry
 
+# Letterbox fill in BGRA; RGB32 expects the alpha byte to be 0xff.
+_OPAQUE_BLACK = np.array([0, 0, 0, 255], dtype=np.uint8)
+
 
 class VideoCanvas(QWidget):
     """Widget that renders all video panels in a grid layout.
@@ -33,6 +50,7 @@ class VideoCanvas(QWidget):
         self._video_manager = video_manager
         self._frame_cache = frame_cache
         self._current_frame: int = 0
+        self._pending_prefetch: int = 0
         self._rows: int = 1
         self._display_mode: str = "side_by_side"  # "side_by_side" | "single_view"
         self._single_view_index: int = 0
@@ -49,17 +67,61 @@ class VideoCanvas(QWidget):
         self._pan_last: QPoint | None = None
         self._pan_panel_idx: int | None = None
 
+        # Per-panel BGRA buffers reused across paints, and the QImages that
+        # wrap them without copying; both are keyed by video-list index and
+        # (re)created together whenever the panel size changes.
+        self._panel_bufs: dict[int, np.ndarray] = {}
+        self._panel_qimages: dict[int, QImage] = {}
+        # Per-thread BGR scratch the letterbox resize writes before widening
+        # to BGRA; render workers each keep their own.
+        self._scratch = threading.local()
+
+        # Panel rectangles by video-list index, rebuilt when the key
+        # (size, rows, display mode, video count) changes.
+        self._panel_rects: list[QRect] = []
+        self._panel_rects_key: tuple | None = None
+
+        # Outlined panel labels rendered once per (label, panel size, DPR):
+        # (pixmap, x offset of its left edge from the panel's).
+        self._label_cache: dict[tuple[str, int, int, float], tuple[QPixmap, int]] = {}
+
+        # Worker threads for per-panel decode/filter/resize, created on first use.
+        self._render_pool: ThreadPoolExecutor | None = None
+
+        # While zooming, panning or drawing a selection, panels are resized
+        # with INTER_NEAREST; once input has been idle for a moment a final
+        # repaint restores the full-quality interpolation.
+        self._interaction_timer = QTimer(self)
+        self._interaction_timer.setSingleShot(True)
+        self._interaction_timer.setInterval(150)
+        self._interaction_timer.timeout.connect(self.update)
+
+        # Mouse and wheel input can arrive faster than the display refreshes;
+        # their repaints are coalesced to at most one per ~8 ms.
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(8)
+        self._repaint_timer.timeout.connect(self.update)
+
         self.setMouseTracking(False)
         self.setFocusPolicy(Qt.StrongFocus)
 
     # ── Public API ────────────────────────────────────────────────────
 
-    def set_frame(self, frame_idx: int) -> None:
+    def set_frame(self, frame_idx: int, prefetch: int = 0) -> None:
+        """Show *frame_idx*; with *prefetch*, then decode that many following
+        frames in the background.
+
+        The prefetch starts once the frame has been painted, so the background
+        decode never races the paint for the captures and forces a seek back.
+        """
         self._current_frame = frame_idx
+        self._pending_prefetch = prefetch
         self.update()
 
     def set_rows(self, rows: int) -> None:
         self._rows = max(1, rows)
+        self._clear_panel_buffers()
         self.update()
 
     def set_display_mode(self, mode: str) -> None:
@@ -81,20 +143,53 @@ class VideoCanvas(QWidget):
     def roi(self) -> tuple[float, float, float, float] | None:
         return self._roi
 
+    @property
+    def _preview_mode(self) -> bool:
+        """True while an interaction is in progress and paints may trade quality for speed."""
+        return (
+            self._drag_start is not None
+            or self._pan_last is not None
+            or self._interaction_timer.isActive()
+        )
+
+    def _schedule_repaint(self) -> None:
+        """Request a repaint from an input handler, coalescing bursts."""
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def _clear_panel_buffers(self) -> None:
+        """Drop the per-panel buffers after a layout change; paint reallocates them."""
+        self._panel_qimages.clear()
+        self._panel_bufs.clear()
+        self._panel_rects_key = None
+        self._label_cache.clear()
+
     # ── Grid geometry helpers ─────────────────────────────────────────
 
     def _grid_cols(self, count: int) -> int:
         return math.ceil(count / self._rows) if self._rows > 0 else 1
 
-    def _get_panel_rect(self, video_index: int) -> QRect:
-        videos = self._video_manager.get_all_videos()
-        if video_index < 0 or video_index >= len(videos):
-            return QRect()
+    def _ensure_panel_rects(self) -> list[QRect]:
+        """Return the panel rect of every video, rebuilding the table if stale."""
+        count = self._video_manager.video_count
+        key = (
+            self.width(),
+            self.height(),
+            self._rows,
+            self._display_mode,
+            self._single_view_index,
+            count,
+        )
+        if key != self._panel_rects_key:
+            self._panel_rects = [self._compute_panel_rect(i, count) for i in range(count)]
+            self._panel_rects_key = key
+        return self._panel_rects
+
+    def _compute_panel_rect(self, video_index: int, count: int) -> QRect:
         if self._display_mode == "single_view":
             if video_index == self._single_view_index:
                 return self.rect()
             return QRect()
-        count = len(videos)
         cols = self._grid_cols(count)
         w = self.width() // cols
         h = self.height() // self._rows
@@ -102,17 +197,35 @@ class VideoCanvas(QWidget):
         row = video_index // cols
         return QRect(col * w, row * h, w, h)
 
+    def _get_panel_rect(self, video_index: int) -> QRect:
+        rects = self._ensure_panel_rects()
+        if video_index < 0 or video_index >= len(rects):
+            return QRect()
+        return rects[video_index]
+
     def _panel_index_at(self, pos: QPoint) -> int | None:
         """Return the video-list index whose panel contains *pos*, or None."""
-        videos = self._video_manager.get_all_videos()
         if self._display_mode == "single_view":
-            if videos and self.rect().contains(pos):
+            if self._video_manager.video_count and self.rect().contains(pos):
                 return self._single_view_index
             return None
-        for idx in range(len(videos)):
-            if self._get_panel_rect(idx).contains(pos):
-                return idx
-        return None
+        # Panels form a regular grid, so the hit test is arithmetic; the
+        # remainder pixels right of and below the grid belong to no panel.
+        count = self._video_manager.video_count
+        if count == 0:
+            return None
+        cols = self._grid_cols(count)
+        pw = self.width() // cols
+        ph = self.height() // self._rows
+        x, y = pos.x(), pos.y()
+        if pw <= 0 or ph <= 0 or x < 0 or y < 0:
+            return None
+        col = x // pw
+        row = y // ph
+        if col >= cols or row >= self._rows:
+            return None
+        idx = row * cols + col
+        return idx if idx < count else None
 
     def _content_rect_in_panel(self, panel_rect: QRect, frame_w: int, frame_h: int) -> QRectF:
         """Return the sub-rect inside *panel_rect* that the frame content occupies
@@ -149,14 +262,26 @@ class VideoCanvas(QWidget):
 
     def _crop_to_roi(self, frame: np.ndarray) -> np.ndarray:
         """Crop *frame* to the current ROI (if set)."""
-        if self._roi is None:
+        roi = self._roi
+        if roi is None:
             return frame
-        h, w = frame.shape[:2]
-        x1, y1, x2, y2 = self._roi
-        cx1 = max(0, int(x1 * w))
-        cy1 = max(0, int(y1 * h))
-        cx2 = min(w, int(x2 * w))
-        cy2 = min(h, int(y2 * h))
+        x1, y1, x2, y2 = roi
+        shape = frame.shape
+        h, w = shape[0], shape[1]
+        # Plain comparisons: called per panel and per reference frame on every
+        # paint, where builtin min/max (or np.clip) calls cost more than the math.
+        cx1 = int(x1 * w)
+        cy1 = int(y1 * h)
+        cx2 = int(x2 * w)
+        cy2 = int(y2 * h)
+        if cx1 < 0:
+            cx1 = 0
+        if cy1 < 0:
+            cy1 = 0
+        if cx2 > w:
+            cx2 = w
+        if cy2 > h:
+            cy2 = h
         if cx2 <= cx1 or cy2 <= cy1:
             return frame
         return frame[cy1:cy2, cx1:cx2]
@@ -186,64 +311,73 @@ class VideoCanvas(QWidget):
             panel_w = self.width() // cols
             panel_h = self.height() // self._rows
 
-        painter = QPainter(self)
+        preview = self._preview_mode
+        rects = self._ensure_panel_rects()
+        panels: list[tuple[int, QRect, np.ndarray | None]] = []
         for idx in indices:
-            video = videos[idx]
-            rect = self._get_panel_rect(idx)
+            rect = rects[idx]
             if rect.isEmpty():
                 continue
+            buf = None
+            if panel_w > 0 and panel_h > 0:
+                buf = self._panel_bufs.get(idx)
+                if buf is None or buf.shape[:2] != (panel_h, panel_w):
+                    buf = np.empty((panel_h, panel_w, 4), dtype=np.uint8)
+                    self._panel_bufs[idx] = buf
+                    # BGRA bytes are Qt's native RGB32 (0xffRRGGBB) on
+                    # little-endian hosts, which drawImage blits without a
+                    # format conversion; the QImage sees every new render.
+                    self._panel_qimages[idx] = QImage(
+                        buf.data, panel_w, panel_h, panel_w * 4, QImage.Format.Format_RGB32
+                    )
+            panels.append((idx, rect, buf))
 
-            frame = self._frame_cache.get(video.video_id, self._current_frame)
-            if frame is None:
-                frame = video.read_frame(self._current_frame)
-                if frame is not None:
-                    self._frame_cache.put(video.video_id, self._current_frame, frame)
-
-            if frame is not None:
-                frame = self._crop_to_roi(frame)
-
-            if frame is not None and video.filter is not None:
-                ref_frame = None
-                if video.filter.needs_reference and hasattr(video.filter, "ref_video_id"):
-                    ref_id = video.filter.ref_video_id
-                    if ref_id is not None:
-                        ref_entry = self._video_manager.get_video(ref_id)
-                        if ref_entry is not None:
-                            ref_frame = self._frame_cache.get(ref_id, self._current_frame)
-                            if ref_frame is None:
-                                ref_frame = ref_entry.read_frame(self._current_frame)
-                                if ref_frame is not None:
-                                    self._frame_cache.put(ref_id, self._current_frame, ref_frame)
-                            if ref_frame is not None:
-                                ref_frame = self._crop_to_roi(ref_frame)
-                frame = video.filter.apply(frame, ref_frame)
+        if len(panels) == 1 and videos[panels[0][0]].filter is None:
+            # Common case of one unfiltered panel (a single video, or
+            # single-view mode): no reference frames, no pool, no filter.
+            drawn = [self._render_plain_panel(videos[panels[0][0]], panels[0][2], preview)]
+        else:
+            # Reference frames are fetched and cropped once per paint, however
+            # many panels diff against them; panels showing a reference video
+            # then find their frame in the cache.
+            ref_entries: dict[int, "VideoEntry | None"] = {}
+            for idx, _, buf in panels:
+                flt = videos[idx].filter
+                if buf is not None and flt is not None and flt.needs_reference:
+                    ref_id = getattr(flt, "ref_video_id", None)
+                    if ref_id is not None and ref_id not in ref_entries:
+                        ref_entries[ref_id] = self._video_manager.get_video(ref_id)
+            ref_frames = self._fetch_ref_frames(ref_entries)
+
+            # Phase 1: decode, filter and letterbox every panel into its buffer,
+            # concurrently when there are several (OpenCV and the decoders release
+            # the GIL). Phase 2 below composites on the GUI thread.
+            if len(panels) > 1:
+                pool = self._get_render_pool()
+                futures = [
+                    pool.submit(self._render_panel, videos[idx], buf, preview, ref_frames)
+                    for idx, _, buf in panels
+                ]
+                drawn = [f.result() for f in futures]
+            else:
+                drawn = [
+                    self._render_panel(videos[idx], buf, preview, ref_frames)
+                    for idx, _, buf in panels
+                ]
 
-            if frame is not None:
-                frame = self._resize_letterbox(frame, panel_w, panel_h)
-                rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                h, w = rgb.shape[:2]
-                bpl = w * 3
-                qimg = QImage(rgb.data, w, h, bpl, QImage.Format.Format_RGB888).copy()
-                painter.drawImage(rect.topLeft(), qimg)
+        painter = QPainter(self)
+        for (idx, rect, _), has_frame in zip(panels, drawn):
+            video = videos[idx]
+            if has_frame:
+                painter.drawImage(rect.topLeft(), self._panel_qimages[idx])
 
             # Label
-            label = video.label
-            font = painter.font()
-            px = max(10, panel_h // 20)
-            font.setPixelSize(px)
-            fm = QFontMetrics(font)
-            margin = 8
-            while fm.horizontalAdvance(label) > panel_w - margin and px > 8:
-                px -= 1
-                font.setPixelSize(px)
-                fm = QFontMetrics(font)
-            painter.setFont(font)
-            flags = Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter
-            painter.setPen(Qt.GlobalColor.black)
-            for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                painter.drawText(rect.adjusted(dx, dy, dx, dy), flags, label)
-            painter.setPen(Qt.GlobalColor.white)
-            painter.drawText(rect, flags, label)
+            label_pm, label_x = self._label_pixmap(video.label, panel_w, panel_h)
+            painter.drawPixmap(rect.x() + label_x, rect.y() - 1, label_pm)
+
+        if self._pending_prefetch > 0:
+            self._frame_cache.prefetch(videos, self._current_frame + 1, self._pending_prefetch)
+            self._pending_prefetch = 0
 
         # Draw rubber-band selection rectangle while dragging
         if self._drag_start is not None and self._drag_current is not None:
@@ -252,23 +386,189 @@ class VideoCanvas(QWidget):
             painter.setBrush(QColor(255, 255, 0, 40))
             painter.drawRect(sel)
 
+    def _label_pixmap(self, label: str, panel_w: int, panel_h: int) -> tuple[QPixmap, int]:
+        """Return *label* pre-rendered white on a 1 px black outline.
+
+        The pixmap is drawn at (panel x + offset, panel y - 1) and reproduces
+        the centred, top-aligned text the panel would get from drawText.
+        """
+        dpr = self.devicePixelRatioF()
+        key = (label, panel_w, panel_h, dpr)
+        cached = self._label_cache.get(key)
+        if cached is not None:
+            return cached
+
+        font = QFont(self.font())
+        max_px = max(10, panel_h // 20)
+        font.setPixelSize(max_px)
+        fm = QFontMetrics(font)
+        avail = panel_w - 8  # margin
+        advance = fm.horizontalAdvance(label)
+        if advance > avail:
+            # Shrink to the largest size in [8, max_px) that fits: solve from
+            # the width ratio, then settle the +-1 px that hinting makes
+            # non-linear, instead of measuring every size on the way down.
+            px = max(8, min(max_px - 1, int(max_px * avail / advance)))
+            font.setPixelSize(px)
+            fm = QFontMetrics(font)
+            while px > 8 and fm.horizontalAdvance(label) > avail:
+                px -= 1
+                font.setPixelSize(px)
+                fm = QFontMetrics(font)
+            while px + 1 < max_px:
+                bigger = QFont(font)
+                bigger.setPixelSize(px + 1)
+                bigger_fm = QFontMetrics(bigger)
+                if bigger_fm.horizontalAdvance(label) > avail:
+                    break
+                px, font, fm = px + 1, bigger, bigger_fm
+
+        # Labels too long even at the minimum size overhang the panel, as
+        # drawText would let them.
+        text_w = max(panel_w, fm.horizontalAdvance(label))
+        text_h = fm.height()
+        pm = QPixmap(math.ceil((text_w + 2) * dpr), math.ceil((text_h + 2) * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pm)
+        p.setFont(font)
+        text_rect = QRect(1, 1, text_w, text_h)
+        flags = Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter
+        p.setPen(Qt.GlobalColor.black)
+        for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
+            p.drawText(text_rect.adjusted(dx, dy, dx, dy), flags, label)
+        p.setPen(Qt.GlobalColor.white)
+        p.drawText(text_rect, flags, label)
+        p.end()
+
+        cached = (pm, (panel_w - text_w) // 2 - 1)
+        self._label_cache[key] = cached
+        return cached
+
+    def _get_render_pool(self) -> ThreadPoolExecutor:
+        if self._render_pool is None:
+            # Half the cores: the cv2 calls inside each worker already fan
+            # out onto OpenCV's own thread pool (sized once in
+            # visualize.main), so a worker per core would over-subscribe.
+            self._render_pool = ThreadPoolExecutor(
+                max_workers=max(2, (os.cpu_count() or 4) // 2),
+                thread_name_prefix="canvas-render",
+            )
+        return self._render_pool
+
+    def _fetch_frame(self, video: "VideoEntry") -> np.ndarray | None:
+        """Return the current frame of *video* from the cache, decoding it on a miss."""
+        frame = self._frame_cache.get(video.video_id, self._current_frame)
+        if frame is None:
+            frame = video.read_frame(self._current_frame)
+            if frame is not None:
+                self._frame_cache.put(video.video_id, self._current_frame, frame)
+        return frame
+
+    def _fetch_ref_frames(
+        self, ref_entries: dict[int, "VideoEntry | None"]
+    ) -> dict[int, np.ndarray | None]:
+        """Return the ROI-cropped current frame of each reference video by id."""
+
+        def fetch(entry: "VideoEntry | None") -> np.ndarray | None:
+            frame = self._fetch_frame(entry) if entry is not None else None
+            return self._crop_to_roi(frame) if frame is not None else None
+
+        if len(ref_entries) > 1:
+            pool = self._get_render_pool()
+            futures = {ref_id: pool.submit(fetch, e) for ref_id, e in ref_entries.items()}
+            return {ref_id: f.result() for ref_id, f in futures.items()}
+        return {ref_id: fetch(e) for ref_id, e in ref_entries.items()}
+
+    def _render_plain_panel(
+        self, video: "VideoEntry", buf: np.ndarray | None, preview: bool
+    ) -> bool:
+        """_render_panel for a video without a filter, run on the GUI thread."""
+        if buf is None:
+            return False
+        frame = self._fetch_frame(video)
+        if frame is None:
+            return False
+        self._blit_letterbox(self._crop_to_roi(frame), buf, preview)
+        return True
+
+    def _render_panel(
+        self,
+        video: "VideoEntry",
+        buf: np.ndarray | None,
+        preview: bool,
+        ref_frames: dict[int, np.ndarray | None],
+    ) -> bool:
+        """Render *video*'s current frame into the panel buffer *buf*.
+
+        *ref_frames* holds the already cropped reference frames by video id.
+        Runs on a render-pool thread; it only reads canvas state, which the
+        GUI thread does not change while it waits for the result. Returns
+        False if there is nothing to draw.
+        """
+        if buf is None:
+            return False
+        frame = self._fetch_frame(video)
+        if frame is None:
+            return False
+        frame = self._crop_to_roi(frame)
+
+        flt = video.filter
+        if flt is not None:
+            ref_frame = None
+            if flt.needs_reference:
+                ref_frame = ref_frames.get(getattr(flt, "ref_video_id", None))
+            frame = flt.apply(frame, ref_frame)
+
+        self._blit_letterbox(frame, buf, preview)
+        return True
+
+    def resizeEvent(self, event: object) -> None:
+        self._clear_panel_buffers()
+        super().resizeEvent(event)
+
     # ── Letterbox resize ──────────────────────────────────────────────
 
-    def _resize_letterbox(self, frame: np.ndarray, target_w: int, target_h: int) -> np.ndarray:
+    def _blit_letterbox(self, frame: np.ndarray, dst: np.ndarray, preview: bool = False) -> None:
+        """Letterbox the BGR *frame* into the BGRA panel buffer *dst*.
+
+        The frame is resized into a reused per-thread scratch and widened to
+        BGRA straight into the centred region of the panel buffer; only the
+        border strips are filled with opaque black, so no frame-sized arrays
+        are allocated. Strong downscales use INTER_AREA, and *preview* uses
+        INTER_NEAREST.
+        """
+        target_h, target_w = dst.shape[:2]
         h, w = frame.shape[:2]
-        if w <= 0 or h <= 0 or target_w <= 0 or target_h <= 0:
-            return frame
+        if w <= 0 or h <= 0:
+            dst[:] = _OPAQUE_BLACK
+            return
         scale = min(target_w / w, target_h / h)
-        new_w = max(1, int(w * scale))
-        new_h = max(1, int(h * scale))
-        resized = cv2.resize(frame, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
-        pad_w = target_w - new_w
-        pad_h = target_h - new_h
-        top = pad_h // 2
-        bottom = pad_h - top
-        left = pad_w // 2
-        right = pad_w - left
-        return cv2.copyMakeBorder(resized, top, bottom, left, right, cv2.BORDER_CONSTANT, value=(0, 0, 0))
+        new_w = max(1, min(target_w, int(w * scale)))
+        new_h = max(1, min(target_h, int(h * scale)))
+        top = (target_h - new_h) // 2
+        left = (target_w - new_w) // 2
+        bottom = top + new_h
+        right = left + new_w
+
+        if preview:
+            interpolation = cv2.INTER_NEAREST
+        elif scale < 0.5:
+            interpolation = cv2.INTER_AREA
+        else:
+            interpolation = cv2.INTER_LINEAR
+
+        scratch = getattr(self._scratch, "bgr", None)
+        if scratch is None or scratch.shape[:2] != (new_h, new_w):
+            scratch = np.empty((new_h, new_w, 3), dtype=np.uint8)
+            self._scratch.bgr = scratch
+        cv2.resize(frame, (new_w, new_h), dst=scratch, interpolation=interpolation)
+        cv2.cvtColor(scratch, cv2.COLOR_BGR2BGRA, dst=dst[top:bottom, left:right])
+
+        dst[:top] = _OPAQUE_BLACK
+        dst[bottom:] = _OPAQUE_BLACK
+        dst[top:bottom, :left] = _OPAQUE_BLACK
+        dst[top:bottom, right:] = _OPAQUE_BLACK
 
     # ── Mouse events ──────────────────────────────────────────────────
 
@@ -288,15 +588,15 @@ class VideoCanvas(QWidget):
                     self._pan_last = event.position().toPoint()
             event.accept()
         elif event.button() == Qt.MouseButton.RightButton:
-            videos = self._video_manager.get_all_videos()
             pos = event.position().toPoint()
-            for idx in range(len(videos)):
-                if self._get_panel_rect(idx).contains(pos):
-                    self.context_menu_requested.emit(
-                        videos[idx].video_id,
-                        self.mapToGlobal(pos),
-                    )
-                    return
+            idx = self._panel_index_at(pos)
+            videos = self._video_manager.get_all_videos()
+            if idx is not None and idx < len(videos):
+                self.context_menu_requested.emit(
+                    videos[idx].video_id,
+                    self.mapToGlobal(pos),
+                )
+                return
             event.accept()
         else:
             super().mousePressEvent(event)
@@ -307,7 +607,7 @@ class VideoCanvas(QWidget):
             event.accept()
         elif self._drag_start is not None:
             self._drag_current = event.position().toPoint()
-            self.update()
+            self._schedule_repaint()
         else:
             super().mouseMoveEvent(event)
 
@@ -315,6 +615,7 @@ class VideoCanvas(QWidget):
         if event.button() == Qt.MouseButton.MiddleButton and self._pan_last is not None:
             self._pan_last = None
             self._pan_panel_idx = None
+            self.update()  # full-quality repaint after the preview-mode pan
             event.accept()
         elif event.button() == Qt.MouseButton.LeftButton and self._drag_start is not None:
             end = event.position().toPoint()
@@ -363,58 +664,22 @@ class VideoCanvas(QWidget):
         vn = self._screen_to_norm(event.position().toPoint(), panel_rect, fw, fh)
         ax, ay = self._visible_to_abs(vn[0], vn[1])
 
+        self._interaction_timer.start()
+
         # Smooth zoom: 0.85 per notch (120 units), supporting fractional notches
         _ZOOM_BASE = 0.85
         steps = delta / 120.0
         factor = _ZOOM_BASE ** steps
 
         x1, y1, x2, y2 = self._roi if self._roi is not None else (0.0, 0.0, 1.0, 1.0)
-        w = x2 - x1
-        h = y2 - y1
-
-        new_w = w * factor
-        new_h = h * factor
-
-        if new_w >= 1.0 and new_h >= 1.0:
-            self._roi = None
-            self.update()
-            event.accept()
-            return
-
-        # Anchor: keep the point under the cursor stationary
-        rel_x = (ax - x1) / w if w > 0 else 0.5
-        rel_y = (ay - y1) / h if h > 0 else 0.5
-
-        new_x1 = ax - rel_x * new_w
-        new_y1 = ay - rel_y * new_h
-        new_x2 = new_x1 + new_w
-        new_y2 = new_y1 + new_h
-
-        # Shift (not squeeze) to keep within [0, 1]
-        if new_x1 < 0:
-            new_x2 -= new_x1
-            new_x1 = 0.0
-        if new_y1 < 0:
-            new_y2 -= new_y1
-            new_y1 = 0.0
-        if new_x2 > 1.0:
-            new_x1 -= new_x2 - 1.0
-            new_x2 = 1.0
-        if new_y2 > 1.0:
-            new_y1 -= new_y2 - 1.0
-            new_y2 = 1.0
-
-        new_x1 = max(0.0, new_x1)
-        new_y1 = max(0.0, new_y1)
-        new_x2 = min(1.0, new_x2)
-        new_y2 = min(1.0, new_y2)
+        new_x1, new_y1, new_x2, new_y2 = compute_zoom_roi(x1, y1, x2, y2, factor, ax, ay)
 
         if new_x2 - new_x1 >= 0.999 and new_y2 - new_y1 >= 0.999:
             self._roi = None
         else:
             self._roi = (new_x1, new_y1, new_x2, new_y2)
 
-        self.update()
+        self._schedule_repaint()
         event.accept()
 
     def _finalize_roi(self, start: QPoint, end: QPoint) -> None:
@@ -485,28 +750,6 @@ class VideoCanvas(QWidget):
         dx_norm = -((pos.x() - self._pan_last.x()) / cr.width()) * roi_w
         dy_norm = -((pos.y() - self._pan_last.y()) / cr.height()) * roi_h
 
-        new_x1 = x1 + dx_norm
-        new_y1 = y1 + dy_norm
-        new_x2 = x2 + dx_norm
-        new_y2 = y2 + dy_norm
-
-        # Clamp by shifting, not squeezing
-        if new_x1 < 0:
-            new_x2 -= new_x1
-            new_x1 = 0.0
-        if new_y1 < 0:
-            new_y2 -= new_y1
-            new_y1 = 0.0
-        if new_x2 > 1.0:
-            new_x1 -= new_x2 - 1.0
-            new_x2 = 1.0
-        if new_y2 > 1.0:
-            new_y1 -= new_y2 - 1.0
-            new_y2 = 1.0
-
-        self._roi = (
-            max(0.0, new_x1), max(0.0, new_y1),
-            min(1.0, new_x2), min(1.0, new_y2),
-        )
+        self._roi = compute_pan_roi(x1, y1, x2, y2, dx_norm, dy_norm)
         self._pan_last = pos
-        self.update()
+        self._schedule_repaint()
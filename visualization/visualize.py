@@ -20,36 +20,40 @@ Sample calls:
 
 import argparse
 import logging
+import os
+import re
 import sys
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# One comma-separated filter spec per match: video id, filter name and the
+# optional colon-separated parameters, or (last group) anything malformed.
+_FILTER_RE = re.compile(
+    r"\s*(?:(\d+)\s*:\s*([^:,]*?)\s*(?::([^,]*))?|([^,]*?))\s*(?:,|$)"
+)
+
 
 def _parse_filters(filter_str: str) -> list[dict]:
     """Parse CLI filter specification string.
 
-    Format: "<video_id>:<filter_name>[:<param>=<value>,...], ..."
+    Format: "<video_id>:<filter_name>[:<param>=<value>...], ..."
     Example: "1:Difference Heatmap:ref=0, 2:Difference Heatmap:ref=0"
     """
     specs = []
-    for part in filter_str.split(","):
-        part = part.strip()
-        if not part:
-            continue
-        tokens = part.split(":")
-        if len(tokens) < 2:
-            logger.warning("Ignoring malformed filter spec: %s", part)
+    for m in _FILTER_RE.finditer(filter_str):
+        video_id, filter_name, param_str, malformed = m.groups()
+        if video_id is None:
+            if malformed:
+                logger.warning("Ignoring malformed filter spec: %s", malformed)
             continue
-        video_id = int(tokens[0].strip())
-        filter_name = tokens[1].strip()
         params = {}
-        for kv in tokens[2:]:
-            kv = kv.strip()
-            if "=" in kv:
-                k, v = kv.split("=", 1)
-                params[k.strip()] = v.strip()
-        specs.append({"video_id": video_id, "name": filter_name, "params": params})
+        if param_str:
+            for kv in param_str.split(":"):
+                k, sep, v = kv.partition("=")
+                if sep:
+                    params[k.strip()] = v.strip()
+        specs.append({"video_id": int(video_id), "name": filter_name, "params": params})
     return specs
 
 
@@ -88,7 +92,6 @@ def _apply_cli_captions(video_manager, captions_str: str) -> None:
 
 def _run_headless_export(args, video_manager, frame_cache) -> int:
     """Perform export without opening a GUI window."""
-    from visualization.core.audio_player import AudioPlayer
     from visualization.core.exporter import Exporter
 
     if not args.export:
@@ -171,17 +174,24 @@ def main() -> int:
     args = parser.parse_args()
     logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
+    import cv2
+
     from visualization.core.video_manager import FrameCache, VideoManager
 
+    # Optimised (SIMD) kernels can be switched off by the environment. OpenCV's
+    # thread count is process-wide, so it is set here once and nothing else
+    # changes it: its internal parallelism (resize, colour conversion, filter
+    # kernels) may use every core.
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(os.cpu_count() or 4)
+
     video_manager = VideoManager()
     frame_cache = FrameCache()
 
     if args.videos:
-        for p in args.videos:
-            try:
-                video_manager.load_video(p)
-            except (ValueError, FileNotFoundError, RuntimeError) as e:
-                logger.error("Cannot load '%s': %s", p, e)
+        for p, result in zip(args.videos, video_manager.load_videos(args.videos)):
+            if isinstance(result, Exception):
+                logger.error("Cannot load '%s': %s", p, result)
                 return 1
 
     if args.captions:
@@ -206,7 +216,9 @@ def main() -> int:
     if args.audio_source is not None:
         entry = video_manager.get_video(args.audio_source)
         if entry and entry.info.has_audio:
-            audio_player.set_source(entry.info.path, entry.info.fps)
+            audio_player.set_source(
+                entry.info.path, entry.info.fps, entry.info.duration_sec
+            )
 
     window = MainWindow(
         video_manager=video_manager,
@@ -220,7 +232,7 @@ def main() -> int:
         from visualization.core.exporter import Exporter
 
         exporter = Exporter(video_manager, frame_cache)
-        audio_path = audio_player._source_path
+        audio_path = audio_player.source_path
         try:
             exporter.export(
                 output_path=args.export,